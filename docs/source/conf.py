@@ -70,6 +70,11 @@ napoleon_type_aliases = None
 # Autosummary settings
 autosummary_generate = True
 
+# Autodoc settings
+# Stub out third-party runtime dependencies so autodoc only has to import the
+# snowpylot modules themselves when building the API reference.
+autodoc_mock_imports = ["requests", "bs4"]
+
 # Intersphinx settings
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
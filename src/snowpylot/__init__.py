@@ -6,5 +6,6 @@ __version__ = "1.1.3"
 
 from .caaml_parser import caaml_parser, caaml_url_parser
 from .snow_pit import SnowPit
+from .snow_pit_table import SnowPitTable
 
-__all__ = ["SnowPit", "caaml_parser", "caaml_url_parser"]
+__all__ = ["SnowPit", "SnowPitTable", "caaml_parser", "caaml_url_parser"]
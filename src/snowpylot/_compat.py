@@ -0,0 +1,119 @@
+"""
+Compatibility helpers for the Python versions supported by snowpylot.
+"""
+
+import sys
+import warnings
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple
+
+
+def _add_slots(cls):
+    """
+    Return a copy of a dataclass whose fields are stored in ``__slots__``.
+
+    Backport of ``dataclass(slots=True)`` for Python < 3.10. The class has to be
+    recreated, because ``__slots__`` only takes effect when a class is built.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Remove the class attributes holding the defaults, which would
+        # otherwise conflict with the slot descriptors
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+if TYPE_CHECKING:
+    # Slots do not change the generated fields, so type checkers can treat
+    # slotted dataclasses exactly like regular ones.
+    from dataclasses import dataclass as slotted_dataclass
+else:
+
+    def slotted_dataclass(cls):
+        """
+        Create a dataclass that stores its fields in ``__slots__``.
+
+        Slotted instances have no per-instance ``__dict__``, which keeps the many
+        small records created while parsing (layers, grains, ...) compact.
+        ``dataclass(slots=True)`` is only available from Python 3.10, so older
+        interpreters get the same result from ``_add_slots``.
+        """
+        if sys.version_info >= (3, 10):
+            return dataclass(slots=True)(cls)
+        return _add_slots(dataclass(cls))
+
+
+class LegacySetters:
+    """
+    Mixin keeping the removed ``set_<field>(value)`` methods of the data classes
+    working.
+
+    Fields are assigned directly (``layer.hardness = "F"``); calling the old setter
+    assigns the field and emits a DeprecationWarning. The lookup only runs for
+    attributes that do not exist, so regular attribute access is not affected.
+    """
+
+    __slots__ = ()
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name):
+            field_name = name[4:]
+            if name.startswith("set_") and field_name in self.__dataclass_fields__:
+
+                def setter(value):
+                    warnings.warn(
+                        f"{type(self).__name__}.{name}() is deprecated, assign "
+                        f"{type(self).__name__}.{field_name} directly instead",
+                        DeprecationWarning,
+                        stacklevel=2,
+                    )
+                    setattr(self, field_name, value)
+
+                return setter
+
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+
+def _as_dict_value(value):
+    """Convert a field value for as_dict(), recursing into records and lists"""
+    if isinstance(value, AsDict):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [_as_dict_value(item) for item in value]
+    return value
+
+
+class AsDict:
+    """
+    Mixin adding ``as_dict()`` to the data classes.
+
+    Values derived from other fields (``wetness_desc``, ``num_taps``, ...) are
+    properties, so ``dataclasses.asdict()`` leaves them out. ``as_dict()``
+    returns the fields followed by the computed values named in
+    ``_computed_fields``, converting nested records and lists the same way.
+    """
+
+    __slots__ = ()
+
+    # Names of the computed properties included by as_dict()
+    _computed_fields: ClassVar[Tuple[str, ...]] = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the fields and computed values as a dict."""
+        result = {
+            f.name: _as_dict_value(getattr(self, f.name))
+            for f in fields(self)  # type: ignore[arg-type]
+        }
+        for name in self._computed_fields:
+            result[name] = _as_dict_value(getattr(self, name))
+        return result
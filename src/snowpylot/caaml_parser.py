@@ -1,22 +1,83 @@
 import re
+import sys
 import xml.etree.ElementTree as ET
-import requests
 
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
 from .layer import Grain, Layer
 from .snow_pit import SnowPit
 from .snow_profile import DensityObs, SurfaceCondition, TempObs
-from .stability_tests import ComprTest, ExtColumnTest, PropSawTest, RBlockTest
+from .stability_tests import (
+    ComprTest,
+    ExtColumnTest,
+    PropSawTest,
+    RBlockTest,
+    StabilityTests,
+)
 from .whumpf_data import WhumpfData
 
-
-def caaml_url_parser(file_path):
+# Namespace prefixes of the tags in the caaml.xml file
+_CAAML_TAG = (
+    "{http://caaml.org/Schemas/SnowProfileIACS/v6.0.3}"  # TO DO: get from xml file
+)
+_GML_TAG = "{http://www.opengis.net/gml}"
+_SNOWPILOT_TAG = "{http://www.snowpilot.org/Schemas/caaml}"
+
+# Tags looked up for every pit, built once
+_LOC_REF_TAG = _CAAML_TAG + "locRef"
+_TIME_POSITION_TAG = _CAAML_TAG + "timePosition"
+_META_DATA_TAG = _CAAML_TAG + "metaData"
+_SRC_REF_TAG = _CAAML_TAG + "srcRef"
+_POS_TAG = _GML_TAG + "pos"
+_PIT_NEAR_AVALANCHE_TAG = _SNOWPILOT_TAG + "pitNearAvalanche"
+_WEATHER_COND_TAG = _CAAML_TAG + "weatherCond"
+_SNOW_PROFILE_MEASUREMENTS_TAG = _CAAML_TAG + "SnowProfileMeasurements"
+_PROFILE_DEPTH_TAG = _CAAML_TAG + "profileDepth"
+_HEIGHT_TAG = _CAAML_TAG + "height"
+_STRAT_PROFILE_TAG = _CAAML_TAG + "stratProfile"
+_TEMP_PROFILE_TAG = _CAAML_TAG + "tempProfile"
+_DENSITY_PROFILE_TAG = _CAAML_TAG + "densityProfile"
+_SURF_COND_TAG = _CAAML_TAG + "surfCond"
+_STB_TESTS_TAG = _CAAML_TAG + "stbTests"
+_WHUMPF_DATA_TAG = _SNOWPILOT_TAG + "whumpfData"
+_POSITION_TAG = _CAAML_TAG + "position"
+_AVG_TAG = _CAAML_TAG + "avg"
+_AVG_MAX_TAG = _CAAML_TAG + "avgMax"
+_COMMENT_TAG = _CAAML_TAG + "comment"
+_NAME_TAG = _CAAML_TAG + "name"
+_LAYER_TAG = _CAAML_TAG + "Layer"
+_OBS_TAG = _CAAML_TAG + "Obs"
+_EXT_COLUMN_TEST_TAG = _CAAML_TAG + "ExtColumnTest"
+_COMPR_TEST_TAG = _CAAML_TAG + "ComprTest"
+_RBLOCK_TEST_TAG = _CAAML_TAG + "RBlockTest"
+_PROP_SAW_TEST_TAG = _CAAML_TAG + "PropSawTest"
+
+# "Person" for non-professional users, a contact person for professional ones
+_PERSON_TAGS = frozenset(
+    [_CAAML_TAG + "Person", _CAAML_TAG + "contactPerson", _CAAML_TAG + "ContactPerson"]
+)
+
+# Avalanche fracture depth in SLF customData comments, e.g. "avalanche fracture @ 40 cm"
+_FRACTURE_PATTERN = re.compile(
+    r"avalanche fracture\s*@\s*(\d+(?:\.\d+)?)\s*(cm|mm|m)\b", re.IGNORECASE
+)
+
+
+def caaml_url_parser(file_path, session=None):
     """
     The function receives a URL to a SnowPilot observation and retrieves the caaml.xml file,
+    and returns a populated SnowPit object
+
+    Pass a requests.Session as session when parsing many observations, so that the
+    connection to SnowPilot is reused instead of opened again for every request
     """
-    soup = BeautifulSoup(requests.get(file_path, timeout=10).text, "html.parser")
+    # requests and bs4 are slow to import and only needed here, so they are
+    # looked up in the module namespace, where they can also be patched
+    http = _lazy_global("requests") if session is None else session
+    beautiful_soup = _lazy_global("BeautifulSoup")
+
+    soup = beautiful_soup(http.get(file_path, timeout=10).text, "html.parser")
 
     caaml_href = next(
         (a["href"] for a in soup.find_all("a", href=True) if "caaml" in a.text.lower()),
@@ -27,7 +88,7 @@ def caaml_url_parser(file_path):
         raise ValueError("No caaml.xml file found in the provided URL.")
 
     caaml_url = urljoin(file_path, caaml_href)
-    caaml = requests.get(caaml_url, timeout=10).content
+    caaml = http.get(caaml_url, timeout=10).content
 
     # retrieve the caaml.xml file data
     root = ET.fromstring(caaml)
@@ -35,6 +96,46 @@ def caaml_url_parser(file_path):
     return _parse_caaml(root)
 
 
+def _import_global(name):
+    """
+    Import the HTTP dependency requests or BeautifulSoup and cache it as a
+    module global, so that loading this module does not import them
+    """
+    if name == "requests":
+        import requests
+
+        value = requests
+    elif name == "BeautifulSoup":
+        from bs4 import BeautifulSoup
+
+        value = BeautifulSoup
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _lazy_global(name):
+    """Return a lazily imported module global, importing it if needed"""
+    value = globals().get(name)
+    return _import_global(name) if value is None else value
+
+
+if TYPE_CHECKING:
+    # Let type checkers see the lazily imported names, without the module-level
+    # __getattr__ turning every attribute of this module into Any
+    import requests
+    from bs4 import BeautifulSoup
+else:
+
+    def __getattr__(name):
+        """
+        Import requests and BeautifulSoup on first access of the module
+        attributes of the same name (PEP 562)
+        """
+        return _import_global(name)
+
+
 def caaml_parser(file_path):
     """
     The function receives a path to a SnowPilot caaml.xml file, parses the file,
@@ -44,6 +145,261 @@ def caaml_parser(file_path):
     return _parse_caaml(root)
 
 
+def _intern(text):
+    """
+    Intern a parsed text value so that repeated codes (countries, regions,
+    aspects, ...) share a single string object across pits
+    """
+    return sys.intern(text) if text is not None else None
+
+
+def _read_elevation(location, prop):
+    uom = _intern(prop.get("uom"))
+    for sub_prop in prop.iter(_POSITION_TAG):
+        location.elevation = [round(float(sub_prop.text), 2), uom]
+
+
+def _read_aspect(location, prop):
+    for sub_prop in prop.iter(_POSITION_TAG):
+        location.aspect = _intern(sub_prop.text)
+
+
+def _read_slope_angle(location, prop):
+    uom = _intern(prop.get("uom"))
+    for sub_prop in prop.iter(_POSITION_TAG):
+        location.slope_angle = [sub_prop.text, uom]
+
+
+def _read_country(location, prop):
+    location.country = _intern(prop.text)
+
+
+def _read_region(location, prop):
+    location.region = _intern(prop.text)
+
+
+# Readers of the Location fields found below locRef, by tag
+_LOCATION_FIELDS = {
+    _CAAML_TAG + "ElevationPosition": _read_elevation,
+    _CAAML_TAG + "AspectPosition": _read_aspect,
+    _CAAML_TAG + "SlopeAnglePosition": _read_slope_angle,
+    _CAAML_TAG + "country": _read_country,
+    _CAAML_TAG + "region": _read_region,
+}
+
+
+def _measurement(prop):
+    """Return the [value, uom] of a measurement element, rounded to 2 decimals"""
+    return [round(float(prop.text), 2), prop.get("uom")]
+
+
+def _text(prop):
+    return prop.text
+
+
+def _code(prop):
+    return _intern(prop.text)
+
+
+def _length(prop):
+    """Return the [value, uom] of a stability test depth or length, unrounded"""
+    return [float(prop.text), prop.get("uom")]
+
+
+def _flag(prop):
+    return prop.text == "true"
+
+
+def _field(attribute, convert):
+    """
+    Return a reader that stores the converted value of an element as the given
+    attribute
+    """
+
+    def read_field(obj, prop):
+        setattr(obj, attribute, convert(prop))
+
+    return read_field
+
+
+def _read_grain_form_primary(layer, prop):
+    # grainSize may already have created the primary grain
+    if layer.grain_form_primary is None:
+        layer.grain_form_primary = Grain()
+    layer.grain_form_primary.grain_form = _intern(prop.text)
+
+
+def _read_grain_form_secondary(layer, prop):
+    layer.grain_form_secondary = Grain(grain_form=_intern(prop.text))
+
+
+def _read_grain_size(layer, prop):
+    uom = prop.get("uom")
+
+    if layer.grain_form_primary is None:
+        layer.grain_form_primary = Grain()
+
+    for sub_prop in prop.iter(_AVG_TAG):
+        layer.grain_form_primary.grain_size_avg = [round(float(sub_prop.text), 2), uom]
+
+    for sub_prop in prop.iter(_AVG_MAX_TAG):
+        layer.grain_form_primary.grain_size_max = [round(float(sub_prop.text), 2), uom]
+
+
+def _read_layer_comment(layer, prop):
+    for sub_prop in prop.iter(_COMMENT_TAG):
+        layer.comments = sub_prop.text
+
+
+# Readers of the Layer fields in the children of a stratProfile Layer, by tag
+_LAYER_FIELDS = {
+    _CAAML_TAG + "depthTop": _field("depth_top", _measurement),
+    _CAAML_TAG + "thickness": _field("thickness", _measurement),
+    _CAAML_TAG + "hardness": _field("hardness", _code),
+    _CAAML_TAG + "hardnessTop": _field("hardness_top", _code),
+    _CAAML_TAG + "hardnessBottom": _field("hardness_bottom", _code),
+    _CAAML_TAG + "grainFormPrimary": _read_grain_form_primary,
+    _CAAML_TAG + "grainFormSecondary": _read_grain_form_secondary,
+    _CAAML_TAG + "grainSize": _read_grain_size,
+    _CAAML_TAG + "wetness": _field("wetness", _code),
+    _CAAML_TAG + "layerOfConcern": _field("layer_of_concern", _flag),
+    _META_DATA_TAG: _read_layer_comment,
+}
+
+# Readers of the TempObs fields in the children of a tempProfile Obs, by tag
+_TEMP_OBS_FIELDS = {
+    _CAAML_TAG + "depth": _field("depth", _measurement),
+    _CAAML_TAG + "snowTemp": _field("snow_temp", _measurement),
+}
+
+# Readers of the DensityObs fields in the children of a densityProfile Layer,
+# by tag
+_DENSITY_OBS_FIELDS = {
+    _CAAML_TAG + "depthTop": _field("depth_top", _measurement),
+    _CAAML_TAG + "thickness": _field("thickness", _measurement),
+    _CAAML_TAG + "density": _field("density", _measurement),
+}
+
+
+def _read_no_failure(test, prop):
+    test.test_score = "CTN"
+
+
+# Readers of the fields shared by all stability tests
+_TEST_FIELDS = {
+    _CAAML_TAG + "comment": _field("comment", _text),
+    _CAAML_TAG + "depthTop": _field("depth_top", _length),
+}
+
+# The stability test class, field readers and StabilityTests method adding it,
+# by the tag of the test element below stbTests
+_STABILITY_TESTS = {
+    _EXT_COLUMN_TEST_TAG: (
+        ExtColumnTest,
+        {
+            **_TEST_FIELDS,
+            _CAAML_TAG + "testScore": _field("test_score", _text),
+        },
+        StabilityTests.add_ect,
+    ),
+    _COMPR_TEST_TAG: (
+        ComprTest,
+        {
+            **_TEST_FIELDS,
+            _CAAML_TAG + "fractureCharacter": _field("fracture_character", _text),
+            _CAAML_TAG + "testScore": _field("test_score", _text),
+            _CAAML_TAG + "noFailure": _read_no_failure,
+        },
+        StabilityTests.add_ct,
+    ),
+    _RBLOCK_TEST_TAG: (
+        RBlockTest,
+        {
+            **_TEST_FIELDS,
+            _CAAML_TAG + "fractureCharacter": _field("fracture_character", _text),
+            _CAAML_TAG + "releaseType": _field("release_type", _text),
+            _CAAML_TAG + "testScore": _field("test_score", _text),
+        },
+        StabilityTests.add_rblock,
+    ),
+    _PROP_SAW_TEST_TAG: (
+        PropSawTest,
+        {
+            **_TEST_FIELDS,
+            _CAAML_TAG + "fracturePropagation": _field("fracture_prop", _text),
+            _CAAML_TAG + "cutLength": _field("cut_length", _length),
+            _CAAML_TAG + "columnLength": _field("column_length", _length),
+        },
+        StabilityTests.add_pst,
+    ),
+}
+
+
+def _read_fields(obj, element, readers):
+    """
+    Read the fields of obj from element and its descendants in a single walk,
+    calling the reader registered for each tag
+    """
+    for prop in element.iter():
+        read_field = readers.get(prop.tag)
+        if read_field is not None:
+            read_field(obj, prop)
+
+
+def _read_children(obj, element, readers):
+    """
+    Read the fields of obj from the direct children of element, calling the
+    reader registered for each tag. Cheaper than _read_fields for records whose
+    fields are all children, such as layers and observations.
+    """
+    for prop in element:
+        read_field = readers.get(prop.tag)
+        if read_field is not None:
+            read_field(obj, prop)
+
+
+# Tags of the elements _parse_caaml looks up anywhere in the document
+_INDEXED_TAGS = frozenset(
+    [
+        _LOC_REF_TAG,
+        _TIME_POSITION_TAG,
+        _META_DATA_TAG,
+        _SRC_REF_TAG,
+        _POS_TAG,
+        _PIT_NEAR_AVALANCHE_TAG,
+        _WEATHER_COND_TAG,
+        _SNOW_PROFILE_MEASUREMENTS_TAG,
+        _PROFILE_DEPTH_TAG,
+        _HEIGHT_TAG,
+        _STRAT_PROFILE_TAG,
+        _TEMP_PROFILE_TAG,
+        _DENSITY_PROFILE_TAG,
+        _SURF_COND_TAG,
+        _STB_TESTS_TAG,
+        _WHUMPF_DATA_TAG,
+    ]
+)
+
+
+def _index_elements(root):
+    """
+    Return the elements of the document with a tag in _INDEXED_TAGS, as lists in
+    document order keyed by tag. A single walk of the tree replaces one
+    root.iter(tag) scan per looked up tag.
+    """
+    elements = {}
+    for element in root.iter():
+        if element.tag in _INDEXED_TAGS:
+            elements.setdefault(element.tag, []).append(element)
+    return elements
+
+
+def _first(elements, tag):
+    """Return the first indexed element with the given tag, or None"""
+    found = elements.get(tag)
+    return found[0] if found else None
+
+
 def _parse_caaml(root):
     """
     This function receives the root of a parsed caaml.xml file, parses the file, and returns a populated SnowPit object
@@ -51,24 +407,25 @@ def _parse_caaml(root):
 
     pit = SnowPit()  # create a new SnowPit object
 
-    # tags in the caaml.xml file
-    caaml_tag = (
-        "{http://caaml.org/Schemas/SnowProfileIACS/v6.0.3}"  # TO DO: get from xml file
-    )
-    gml_tag = "{http://www.opengis.net/gml}"
-    snowpilot_tag = "{http://www.snowpilot.org/Schemas/caaml}"
+    # tags in the caaml.xml file, bound to locals for the many lookups below
+    caaml_tag = _CAAML_TAG
+    gml_tag = _GML_TAG
+    snowpilot_tag = _SNOWPILOT_TAG
+
+    # the sections and top-level fields used below, found in one walk of the tree
+    elements = _index_elements(root)
 
     ### Core Info:
     # (pit_id, pit_name, date, user, location, weather, core comments, caaml_version)
-    loc_ref = next(root.iter(caaml_tag + "locRef"), None)
+    loc_ref = _first(elements, _LOC_REF_TAG)
 
     # pit_id
     loc_ref_attrib = loc_ref.attrib if loc_ref is not None else {}
     pit_id_str = (
         loc_ref_attrib.get(gml_tag + "id")
-        or root.attrib.get(gml_tag + "id")
+        or root.get(gml_tag + "id")
         or loc_ref_attrib.get("id")
-        or root.attrib.get("id")
+        or root.get("id")
     )
 
     if pit_id_str is None:
@@ -81,38 +438,37 @@ def _parse_caaml(root):
     elif pit_id_str.startswith("SnowPilot-"):
         pit_id_str = pit_id_str.split("SnowPilot-", 1)[1]
 
-    pit.core_info.set_pit_id(pit_id_str)
+    pit.core_info.pit_id = pit_id_str
 
     # snow_pit_name
     for prop in loc_ref.iter(caaml_tag + "name"):
-        pit.core_info.set_pit_name(prop.text)
+        pit.core_info.pit_name = prop.text
 
     # date
-    for prop in root.iter(caaml_tag + "timePosition"):
-        date = prop.text.split("T")[0] if prop.text is not None else None
-        pit.core_info.set_date(date)
+    for prop in elements.get(_TIME_POSITION_TAG, ()):
+        date = prop.text.partition("T")[0] if prop.text is not None else None
+        pit.core_info.date = date
 
     # Comment
-    meta_data = next(root.iter(caaml_tag + "metaData"), None)
+    meta_data = _first(elements, _META_DATA_TAG)
 
     if meta_data is not None:
         for prop in meta_data.iter(caaml_tag + "comment"):
             comment = prop.text
-            pit.core_info.set_comment(comment)
+            pit.core_info.comment = comment
 
     # caaml_version
-    pit.core_info.set_caaml_version(caaml_tag)
+    pit.core_info.caaml_version = caaml_tag
 
     ## User (operation_id, operation_name, professional, contact_person_id, username)
-    src_ref = next(root.iter(caaml_tag + "srcRef"), None)
+    src_ref = _first(elements, _SRC_REF_TAG)
 
     # operation_id
     for prop in src_ref.iter(caaml_tag + "Operation"):
         operation_id = prop.attrib[gml_tag + "id"]
-        pit.core_info.user.set_operation_id(operation_id)
-        pit.core_info.user.set_professional(
-            True
-        )  # If operation is present, then it is a professional operation
+        pit.core_info.user.operation_id = operation_id
+        # If operation is present, then it is a professional operation
+        pit.core_info.user.professional = True
 
     # operation_name
     names = []
@@ -120,24 +476,21 @@ def _parse_caaml(root):
         for sub_prop in prop.iter(caaml_tag + "name"):
             names.append(sub_prop.text)
     if names:
-        pit.core_info.user.set_operation_name(
-            names[0]
-        )  # Professional pits have operation name and contact name,
+        # Professional pits have operation name and contact name,
         # the operation name is the first name
+        pit.core_info.user.operation_name = names[0]
     else:
-        pit.core_info.user.set_operation_name(None)
+        pit.core_info.user.operation_name = None
 
     # contact_person_id and username
     for prop in src_ref.iter():
-        if prop.tag.endswith(
-            "Person"
-        ):  # can handle "Person" (non-professional) or "ContactPerson" (professional)
+        if prop.tag in _PERSON_TAGS:
             person = prop
-            user_id = person.attrib.get(gml_tag + "id")
-            pit.core_info.user.set_user_id(user_id)
+            user_id = person.get(gml_tag + "id")
+            pit.core_info.user.user_id = user_id
             for sub_prop in person.iter():
-                if sub_prop.tag.endswith("name"):
-                    pit.core_info.user.set_username(sub_prop.text)
+                if sub_prop.tag == _NAME_TAG:
+                    pit.core_info.user.username = sub_prop.text
 
     ## Location:
     # (latitude, longitude, elevation, aspect, slope_angle, country, region,
@@ -145,331 +498,175 @@ def _parse_caaml(root):
 
     # Latitude and Longitude
     try:
-        lat_long = next(root.iter(gml_tag + "pos"), None).text
+        lat_long = _first(elements, _POS_TAG).text
         lat_long = lat_long.split(" ")
-        pit.core_info.location.set_latitude(float(lat_long[0]))
-        pit.core_info.location.set_longitude(float(lat_long[1]))
+        pit.core_info.location.latitude = float(lat_long[0])
+        pit.core_info.location.longitude = float(lat_long[1])
     except AttributeError:
         lat_long = None
 
-    # elevation
-    for prop in loc_ref.iter(caaml_tag + "ElevationPosition"):
-        uom = prop.attrib.get("uom")
-        for sub_prop in prop.iter(caaml_tag + "position"):
-            pit.core_info.location.set_elevation([round(float(sub_prop.text), 2), uom])
-
-    # aspect
-    for prop in loc_ref.iter(caaml_tag + "AspectPosition"):
-        for sub_prop in prop.iter(caaml_tag + "position"):
-            pit.core_info.location.set_aspect(sub_prop.text)
-
-    # slope_angle
-    for prop in loc_ref.iter(caaml_tag + "SlopeAnglePosition"):
-        uom = prop.attrib.get("uom")
-        for sub_prop in prop.iter(caaml_tag + "position"):
-            slope_angle = sub_prop.text
-            pit.core_info.location.set_slope_angle([slope_angle, uom])
-
-    # country
-    for prop in loc_ref.iter(caaml_tag + "country"):
-        pit.core_info.location.set_country(prop.text)
-
-    # region
-    for prop in loc_ref.iter(caaml_tag + "region"):
-        pit.core_info.location.set_region(prop.text)
+    # elevation, aspect, slope_angle, country and region, in a single walk of locRef
+    pit_location = pit.core_info.location
+    _read_fields(pit_location, loc_ref, _LOCATION_FIELDS)
 
     # proximity to avalanches
-    for prop in root.iter(snowpilot_tag + "pitNearAvalanche"):
+    for prop in elements.get(_PIT_NEAR_AVALANCHE_TAG, ()):
         if prop.text == "true":
-            pit.core_info.location.set_pit_near_avalanche(True)
-        try:
-            location = prop.attrib.get("location")
-            pit.core_info.location.set_pit_near_avalanche_location(location)
-        except AttributeError:
-            location = None
+            pit_location.pit_near_avalanche = True
+        pit_location.pit_near_avalanche_location = prop.get("location")
 
     # avalanche fracture depth (SLF customData)
-    fracture_pattern = re.compile(
-        r"avalanche fracture\s*@\s*(\d+(?:\.\d+)?)\s*(cm|mm|m)\b", re.IGNORECASE
-    )
     if meta_data is not None:
         for prop in meta_data.iter():
             if not prop.tag.endswith("text") or prop.text is None:
                 continue
-            match = fracture_pattern.search(prop.text)
+            match = _FRACTURE_PATTERN.search(prop.text)
             if match is None:
                 continue
             depth = round(float(match.group(1)), 2)
             uom = match.group(2)
-            pit.core_info.location.set_avalanche_initiation_height([depth, uom])
-            pit.core_info.location.set_pit_near_avalanche(True)
+            pit.core_info.location.avalanche_initiation_height = [depth, uom]
+            pit.core_info.location.pit_near_avalanche = True
 
     ## Weather Conditions:
     # (sky_cond, precip_ti, air_temp_pres, wind_speed, wind_dir)
-    weather_cond = next(root.iter(caaml_tag + "weatherCond"), None)
+    weather_cond = _first(elements, _WEATHER_COND_TAG)
 
     if weather_cond is not None:
         # sky_cond
         for prop in weather_cond.iter(caaml_tag + "skyCond"):
-            pit.core_info.weather_conditions.set_sky_cond(prop.text)
+            pit.core_info.weather_conditions.sky_cond = prop.text
 
         # precip_ti
         for prop in weather_cond.iter(caaml_tag + "precipTI"):
-            pit.core_info.weather_conditions.set_precip_ti(prop.text)
+            pit.core_info.weather_conditions.precip_ti = prop.text
 
         # air_temp_pres
         for prop in weather_cond.iter(caaml_tag + "airTempPres"):
-            pit.core_info.weather_conditions.set_air_temp_pres(
-                [round(float(prop.text), 2), prop.get("uom")]
-            )
+            pit.core_info.weather_conditions.air_temp_pres = _measurement(prop)
 
         # wind_speed
         for prop in weather_cond.iter(caaml_tag + "windSpd"):
-            pit.core_info.weather_conditions.set_wind_speed(prop.text)
+            pit.core_info.weather_conditions.wind_speed = prop.text
 
         # wind_dir
         for prop in weather_cond.iter(caaml_tag + "windDir"):
             for sub_prop in prop.iter(caaml_tag + "position"):
-                pit.core_info.weather_conditions.set_wind_dir(sub_prop.text)
+                pit.core_info.weather_conditions.wind_dir = sub_prop.text
 
     ### Snow Profile:
     # (layers, temp_profile, density_profile, surf_cond)
 
     # Measurement Direction
-    for prop in root.iter(caaml_tag + "SnowProfileMeasurements"):
-        pit.snow_profile.set_measurement_direction(prop.get("dir"))
+    for prop in elements.get(_SNOW_PROFILE_MEASUREMENTS_TAG, ()):
+        pit.snow_profile.measurement_direction = prop.get("dir")
 
     # Profile Depth
-    for prop in root.iter(caaml_tag + "profileDepth"):
-        pit.snow_profile.set_profile_depth(
-            [round(float(prop.text), 2), prop.get("uom")]
-        )
+    for prop in elements.get(_PROFILE_DEPTH_TAG, ()):
+        pit.snow_profile.profile_depth = _measurement(prop)
 
     # hs
-    for prop in root.iter(caaml_tag + "height"):
-        pit.snow_profile.set_hs([round(float(prop.text), 2), prop.get("uom")])
+    for prop in elements.get(_HEIGHT_TAG, ()):
+        pit.snow_profile.hs = _measurement(prop)
 
     ## layers
-    strat_profile = next(root.iter(caaml_tag + "stratProfile"), None)
+    strat_profile = _first(elements, _STRAT_PROFILE_TAG)
 
     if strat_profile is not None:
-        layers = [layer for layer in strat_profile if layer.tag.endswith("Layer")]
+        layers = [layer for layer in strat_profile if layer.tag == _LAYER_TAG]
+        layer_objs = []
 
         for layer in layers:
             layer_obj = Layer()
+            _read_children(layer_obj, layer, _LAYER_FIELDS)
+            layer_objs.append(layer_obj)
 
-            for prop in layer.iter(caaml_tag + "depthTop"):
-                layer_obj.set_depth_top([round(float(prop.text), 2), prop.get("uom")])
-
-            for prop in layer.iter(caaml_tag + "thickness"):
-                layer_obj.set_thickness([round(float(prop.text), 2), prop.get("uom")])
-
-            for prop in layer.iter(caaml_tag + "hardness"):
-                layer_obj.set_hardness(prop.text)
-
-            for prop in layer.iter(caaml_tag + "hardnessTop"):
-                layer_obj.set_hardness_top(prop.text)
-
-            for prop in layer.iter(caaml_tag + "hardnessBottom"):
-                layer_obj.set_hardness_bottom(prop.text)
-
-            for prop in layer.iter(caaml_tag + "grainFormPrimary"):
-                layer_obj.grain_form_primary = Grain()
-                layer_obj.grain_form_primary.set_grain_form(prop.text)
-
-            for prop in layer.iter(caaml_tag + "grainFormSecondary"):
-                layer_obj.grain_form_secondary = Grain()
-                layer_obj.grain_form_secondary.set_grain_form(prop.text)
-
-            for prop in layer.iter(caaml_tag + "grainSize"):
-                uom = prop.get("uom")
-
-                if layer_obj.grain_form_primary is None:
-                    layer_obj.grain_form_primary = Grain()
-
-                for sub_prop in prop.iter(caaml_tag + "avg"):
-                    layer_obj.grain_form_primary.set_grain_size_avg(
-                        [round(float(sub_prop.text), 2), uom]
-                    )
-
-                for sub_prop in prop.iter(caaml_tag + "avgMax"):
-                    layer_obj.grain_form_primary.set_grain_size_max(
-                        [round(float(sub_prop.text), 2), uom]
-                    )
-
-            for prop in layer.iter(caaml_tag + "wetness"):
-                layer_obj.set_wetness(prop.text)
-
-            for prop in layer.iter(caaml_tag + "layerOfConcern"):
-                layer_obj.set_layer_of_concern(prop.text == "true")
-
-            for prop in layer.iter(caaml_tag + "comment"):
-                layer_obj.set_comments(prop.text)
-
-            pit.snow_profile.add_layer(layer_obj)
+        # Add the layers in one go; the last flagged layer is the layer of concern
+        pit.snow_profile.layers.extend(layer_objs)
+        for layer_obj in reversed(layer_objs):
+            if layer_obj.layer_of_concern:
+                pit.snow_profile.layer_of_concern = layer_obj
+                break
 
     ## temp_profile
-    temp_profile = next(root.iter(caaml_tag + "tempProfile"), None)
+    temp_profile = _first(elements, _TEMP_PROFILE_TAG)
 
     if temp_profile is not None:
-        temp_obs = [obs for obs in temp_profile if obs.tag.endswith("Obs")]
+        temp_obs = [obs for obs in temp_profile if obs.tag == _OBS_TAG]
+        temp_obs_objs = []
 
         for obs in temp_obs:
             temp_obs_obj = TempObs()
+            _read_children(temp_obs_obj, obs, _TEMP_OBS_FIELDS)
+            temp_obs_objs.append(temp_obs_obj)
 
-            for prop in obs.iter(caaml_tag + "depth"):
-                temp_obs_obj.set_depth([round(float(prop.text), 2), prop.get("uom")])
-
-            for prop in obs.iter(caaml_tag + "snowTemp"):
-                temp_obs_obj.set_snow_temp(
-                    [round(float(prop.text), 2), prop.get("uom")]
-                )
-
-            pit.snow_profile.add_temp_obs(temp_obs_obj)
+        pit.snow_profile.temp_profile.extend(temp_obs_objs)
 
     ## density_profile
-    density_profile = next(root.iter(caaml_tag + "densityProfile"), None)
+    density_profile = _first(elements, _DENSITY_PROFILE_TAG)
 
     if density_profile is not None:
-        density_layer = [
-            layer for layer in density_profile if layer.tag.endswith("Layer")
-        ]
+        density_layer = [layer for layer in density_profile if layer.tag == _LAYER_TAG]
+        density_objs = []
 
         for layer in density_layer:
             obs = DensityObs()
-            for prop in layer.iter(caaml_tag + "depthTop"):
-                obs.set_depth_top([round(float(prop.text), 2), prop.get("uom")])
-
-            for prop in layer.iter(caaml_tag + "thickness"):
-                obs.set_thickness([round(float(prop.text), 2), prop.get("uom")])
+            _read_children(obs, layer, _DENSITY_OBS_FIELDS)
+            density_objs.append(obs)
 
-            for prop in layer.iter(caaml_tag + "density"):
-                obs.set_density([round(float(prop.text), 2), prop.get("uom")])
-
-            pit.snow_profile.add_density_obs(obs)
+        pit.snow_profile.density_profile.extend(density_objs)
 
     ## surf_cond
-    surf_cond = next(root.iter(caaml_tag + "surfCond"), None)
+    surf_cond = _first(elements, _SURF_COND_TAG)
 
     if surf_cond is not None:
         pit.snow_profile.surf_cond = SurfaceCondition()
 
         # wind_loading
         for prop in surf_cond.iter(snowpilot_tag + "windLoading"):
-            pit.snow_profile.surf_cond.set_wind_loading(prop.text)
+            pit.snow_profile.surf_cond.wind_loading = _intern(prop.text)
 
         # penetration_foot
         for prop in surf_cond.iter(caaml_tag + "penetrationFoot"):
-            pit.snow_profile.surf_cond.set_penetration_foot(
-                [round(float(prop.text), 2), prop.get("uom")]
-            )
+            pit.snow_profile.surf_cond.penetration_foot = _measurement(prop)
 
         # penetration_ski
         for prop in surf_cond.iter(caaml_tag + "penetrationSki"):
-            pit.snow_profile.surf_cond.set_penetration_ski(
-                [round(float(prop.text), 2), prop.get("uom")]
-            )
+            pit.snow_profile.surf_cond.penetration_ski = _measurement(prop)
 
     ### Stability Tests (test_results)
-    test_results = next(root.iter(caaml_tag + "stbTests"), None)
+    test_results = _first(elements, _STB_TESTS_TAG)
 
     if test_results is not None:
-        ects = [test for test in test_results if test.tag.endswith("ExtColumnTest")]
-        cts = [test for test in test_results if test.tag.endswith("ComprTest")]
-        rblocks = [test for test in test_results if test.tag.endswith("RBlockTest")]
-        psts = [test for test in test_results if test.tag.endswith("PropSawTest")]
-
-        for ect in ects:
-            ect_obj = ExtColumnTest()
-            for prop in ect.iter(caaml_tag + "metaData"):
-                for sub_prop in prop.iter(caaml_tag + "comment"):
-                    ect_obj.set_comment(sub_prop.text)
-            for prop in ect.iter(caaml_tag + "Layer"):
-                for sub_prop in prop.iter(caaml_tag + "depthTop"):
-                    ect_obj.set_depth_top([float(sub_prop.text), sub_prop.get("uom")])
-
-            for prop in ect.iter(caaml_tag + "Results"):
-                for sub_prop in prop.iter(caaml_tag + "testScore"):
-                    ect_obj.set_test_score(sub_prop.text)
-
-            pit.stability_tests.add_ect(ect_obj)
-
-        for ct in cts:
-            ct_obj = ComprTest()
-            for prop in ct.iter(caaml_tag + "metaData"):
-                for sub_prop in prop.iter(caaml_tag + "comment"):
-                    ct_obj.set_comment(sub_prop.text)
-            for prop in ct.iter(caaml_tag + "Layer"):
-                for sub_prop in prop.iter(caaml_tag + "depthTop"):
-                    ct_obj.set_depth_top([float(sub_prop.text), sub_prop.get("uom")])
-            for prop in ct.iter(caaml_tag + "Results"):
-                for sub_prop in prop.iter(caaml_tag + "fractureCharacter"):
-                    ct_obj.set_fracture_character(sub_prop.text)
-                for sub_prop in prop.iter(caaml_tag + "testScore"):
-                    ct_obj.set_test_score(sub_prop.text)
-            for _prop in ct.iter(caaml_tag + "noFailure"):
-                ct_obj.set_test_score("CTN")
-
-            pit.stability_tests.add_ct(ct_obj)
-
-        for rblock in rblocks:
-            rbt = RBlockTest()
-            for prop in rblock.iter(caaml_tag + "metaData"):
-                for sub_prop in prop.iter(caaml_tag + "comment"):
-                    rbt.set_comment(sub_prop.text)
-            for prop in rblock.iter(caaml_tag + "Layer"):
-                for sub_prop in prop.iter(caaml_tag + "depthTop"):
-                    rbt.set_depth_top([float(sub_prop.text), sub_prop.get("uom")])
-            for prop in rblock.iter(caaml_tag + "Results"):
-                for sub_prop in prop.iter(caaml_tag + "fractureCharacter"):
-                    rbt.set_fracture_character(sub_prop.text)
-                for sub_prop in prop.iter(caaml_tag + "releaseType"):
-                    rbt.set_release_type(sub_prop.text)
-                for sub_prop in prop.iter(caaml_tag + "testScore"):
-                    rbt.set_test_score(sub_prop.text)
-
-            pit.stability_tests.add_rblock(rbt)
-
-        for pst in psts:
-            pst_obj = PropSawTest()
-            for prop in pst.iter(caaml_tag + "metaData"):
-                for sub_prop in prop.iter(caaml_tag + "comment"):
-                    pst_obj.set_comment(sub_prop.text)
-            for prop in pst.iter(caaml_tag + "Layer"):
-                for sub_prop in prop.iter(caaml_tag + "depthTop"):
-                    pst_obj.set_depth_top([float(sub_prop.text), sub_prop.get("uom")])
-            for prop in pst.iter(caaml_tag + "Results"):
-                for sub_prop in prop.iter(caaml_tag + "fracturePropagation"):
-                    pst_obj.set_fracture_prop(sub_prop.text)
-                for sub_prop in prop.iter(caaml_tag + "cutLength"):
-                    pst_obj.set_cut_length([float(sub_prop.text), sub_prop.get("uom")])
-                for sub_prop in prop.iter(caaml_tag + "columnLength"):
-                    pst_obj.set_column_length(
-                        [float(sub_prop.text), sub_prop.get("uom")]
-                    )
-
-            pit.stability_tests.add_pst(pst_obj)
+        for test in test_results:
+            spec = _STABILITY_TESTS.get(test.tag)
+            if spec is None:
+                continue
+            test_cls, readers, add_test = spec
+            test_obj = test_cls()
+            _read_fields(test_obj, test, readers)
+            add_test(pit.stability_tests, test_obj)
 
     ### Whumpf Data (whumpf_data)
-    whumpf_data = next(root.iter(snowpilot_tag + "whumpfData"), None)
+    whumpf_data = _first(elements, _WHUMPF_DATA_TAG)
 
     if whumpf_data is not None:
         pit.whumpf_data = WhumpfData()
 
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfCracking"):
-            pit.whumpf_data.set_whumpf_cracking(prop.text)
+            pit.whumpf_data.whumpf_cracking = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfNoCracking"):
-            pit.whumpf_data.set_whumpf_no_cracking(prop.text)
+            pit.whumpf_data.whumpf_no_cracking = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "crackingNoWhumpf"):
-            pit.whumpf_data.set_cracking_no_whumpf(prop.text)
+            pit.whumpf_data.cracking_no_whumpf = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfNearPit"):
-            pit.whumpf_data.set_whumpf_near_pit(prop.text)
+            pit.whumpf_data.whumpf_near_pit = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfDepthWeakLayer"):
-            pit.whumpf_data.set_whumpf_depth_weak_layer(prop.text)
+            pit.whumpf_data.whumpf_depth_weak_layer = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfTriggeredRemoteAva"):
-            pit.whumpf_data.set_whumpf_triggered_remote_ava(prop.text)
+            pit.whumpf_data.whumpf_triggered_remote_ava = prop.text
         for prop in whumpf_data.iter(snowpilot_tag + "whumpfSize"):
-            pit.whumpf_data.set_whumpf_size(prop.text)
+            pit.whumpf_data.whumpf_size = prop.text
     else:
         pit.whumpf_data = None
 
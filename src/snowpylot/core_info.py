@@ -1,9 +1,46 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import Optional, Tuple
 
-
-@dataclass
-class WeatherConditions:
+from ._compat import AsDict, LegacySetters, slotted_dataclass
+
+# Sky condition dictionary
+_SKY_COND_DICT = {
+    "CLR": "Clear",
+    "FEW": "Few",
+    "SCT": "Scattered",
+    "BKN": "Broken",
+    "OVC": "Overcast",
+    "X": "Obscured",
+}
+
+# Precipitation type and intensity dictionary
+_PRECIP_TI_DICT = {
+    "NIL": "None",
+    "S-1": "Snow < 0.5 cm/hr",
+    "S1": "Snow - 1 cm/hr",
+    "S2": "Snow - 2 cm/hr",
+    "S5": "Snow - 5 cm/hr",
+    "S10": "Snow - 10 cm/hr",
+    "G": "Graupel or hail",
+    "RS": "Mixed rain and snow",
+    "RV": "Very light rain - mist",
+    "RL": "Light Rain < 2.5mm/hr",
+    "RM": "Moderate rain < 7.5mm/hr",
+    "RH": "Heavy rain > 7.5mm/hr",
+}
+
+# Wind speed dictionary
+_WIND_SPEED_DICT = {
+    "C": "Calm",
+    "L": "Light breeze",
+    "M": "Moderate",
+    "S": "Strong",
+    "X": "gale force winds",
+}
+
+
+@slotted_dataclass
+class WeatherConditions(AsDict, LegacySetters):
     """
     WeatherConditions class for representing the weather conditions of a snow profile.
 
@@ -13,23 +50,19 @@ class WeatherConditions:
         air_temp_pres: Air temperature with unit
         wind_speed: Wind speed code
         wind_dir: Wind direction
-        sky_cond_desc: Description of sky condition
-        precip_ti_desc: Description of precipitation type and intensity
-        wind_speed_desc: Description of wind speed
+        sky_cond_desc: Description of sky condition (computed)
+        precip_ti_desc: Description of precipitation type and intensity (computed)
+        wind_speed_desc: Description of wind speed (computed)
     """
 
-    # Parsed properties
+    _computed_fields = ("sky_cond_desc", "precip_ti_desc", "wind_speed_desc")
+
     sky_cond: Optional[str] = None
     precip_ti: Optional[str] = None
     air_temp_pres: Optional[Tuple[float, str]] = None
     wind_speed: Optional[str] = None
     wind_dir: Optional[str] = None
 
-    # Computed properties
-    sky_cond_desc: Optional[str] = None
-    precip_ti_desc: Optional[str] = None
-    wind_speed_desc: Optional[str] = None
-
     def __str__(self) -> str:
         """Return a string representation of the weather conditions."""
         return (
@@ -43,92 +76,30 @@ class WeatherConditions:
             f"\n\t wind_dir: {self.wind_dir}"
         )
 
-    def set_sky_cond(self, sky_cond: str) -> None:
-        """
-        Set the sky condition and compute the description.
-
-        Args:
-            sky_cond: The sky condition code
-        """
-        self.sky_cond = sky_cond
-
-        sky_cond_dict = {
-            "CLR": "Clear",
-            "FEW": "Few",
-            "SCT": "Scattered",
-            "BKN": "Broken",
-            "OVC": "Overcast",
-            "X": "Obscured",
-        }
-
-        self.sky_cond_desc = sky_cond_dict.get(sky_cond)
-
-    def set_precip_ti(self, precip_ti: str) -> None:
-        """
-        Set the precipitation type and intensity and compute the description.
-
-        Args:
-            precip_ti: The precipitation type and intensity code
-        """
-        self.precip_ti = precip_ti
-
-        precip_ti_dict = {
-            "NIL": "None",
-            "S-1": "Snow < 0.5 cm/hr",
-            "S1": "Snow - 1 cm/hr",
-            "S2": "Snow - 2 cm/hr",
-            "S5": "Snow - 5 cm/hr",
-            "S10": "Snow - 10 cm/hr",
-            "G": "Graupel or hail",
-            "RS": "Mixed rain and snow",
-            "RV": "Very light rain - mist",
-            "RL": "Light Rain < 2.5mm/hr",
-            "RM": "Moderate rain < 7.5mm/hr",
-            "RH": "Heavy rain > 7.5mm/hr",
-        }
-
-        self.precip_ti_desc = precip_ti_dict.get(precip_ti)
-
-    def set_air_temp_pres(self, air_temp_pres: Tuple[float, str]) -> None:
-        """
-        Set the air temperature.
-
-        Args:
-            air_temp_pres: The air temperature with unit
-        """
-        self.air_temp_pres = air_temp_pres
-
-    def set_wind_speed(self, wind_speed: str) -> None:
-        """
-        Set the wind speed and compute the description.
-
-        Args:
-            wind_speed: The wind speed code
-        """
-        self.wind_speed = wind_speed
-
-        wind_speed_dict = {
-            "C": "Calm",
-            "L": "Light breeze",
-            "M": "Moderate",
-            "S": "Strong",
-            "X": "gale force winds",
-        }
-
-        self.wind_speed_desc = wind_speed_dict.get(wind_speed)
-
-    def set_wind_dir(self, wind_dir: str) -> None:
-        """
-        Set the wind direction.
-
-        Args:
-            wind_dir: The wind direction
-        """
-        self.wind_dir = wind_dir
-
-
-@dataclass
-class Location:
+    @property
+    def sky_cond_desc(self) -> Optional[str]:
+        """Description of the sky condition."""
+        if self.sky_cond is None:
+            return None
+        return _SKY_COND_DICT.get(self.sky_cond)
+
+    @property
+    def precip_ti_desc(self) -> Optional[str]:
+        """Description of the precipitation type and intensity."""
+        if self.precip_ti is None:
+            return None
+        return _PRECIP_TI_DICT.get(self.precip_ti)
+
+    @property
+    def wind_speed_desc(self) -> Optional[str]:
+        """Description of the wind speed."""
+        if self.wind_speed is None:
+            return None
+        return _WIND_SPEED_DICT.get(self.wind_speed)
+
+
+@slotted_dataclass
+class Location(AsDict, LegacySetters):
     """
     Location class for representing a location from a Snowpilot XML file.
 
@@ -159,7 +130,13 @@ class Location:
 
     def __str__(self) -> str:
         """Return a string representation of the location."""
-        location_str = (
+        near_avalanche_location = (
+            f"\n\t pit_near_avalanche_location: {self.pit_near_avalanche_location}"
+            if self.pit_near_avalanche_location is not None
+            else ""
+        )
+
+        return (
             f"\n\t latitude: {self.latitude}"
             f"\n\t longitude: {self.longitude}"
             f"\n\t elevation: {self.elevation}"
@@ -168,113 +145,13 @@ class Location:
             f"\n\t country: {self.country}"
             f"\n\t region: {self.region}"
             f"\n\t pit_near_avalanche: {self.pit_near_avalanche}"
+            f"{near_avalanche_location}"
             f"\n\t avalanche_initiation_height: {self.avalanche_initiation_height}"
         )
 
-        if self.pit_near_avalanche_location is not None:
-            location_str += (
-                f"pit_near_avalanche_location: {self.pit_near_avalanche_location}\n"
-            )
-
-        return location_str
-
-    def set_latitude(self, latitude: float) -> None:
-        """
-        Set the latitude.
-
-        Args:
-            latitude: The latitude
-        """
-        self.latitude = latitude
-
-    def set_longitude(self, longitude: float) -> None:
-        """
-        Set the longitude.
-
-        Args:
-            longitude: The longitude
-        """
-        self.longitude = longitude
-
-    def set_elevation(self, elevation: Tuple[float, str]) -> None:
-        """
-        Set the elevation.
-
-        Args:
-            elevation: The elevation with unit
-        """
-        self.elevation = elevation
-
-    def set_aspect(self, aspect: str) -> None:
-        """
-        Set the aspect.
-
-        Args:
-            aspect: The aspect
-        """
-        self.aspect = aspect
-
-    def set_slope_angle(self, slope_angle: Tuple[float, str]) -> None:
-        """
-        Set the slope angle.
-
-        Args:
-            slope_angle: The slope angle with unit
-        """
-        self.slope_angle = slope_angle
-
-    def set_country(self, country: str) -> None:
-        """
-        Set the country.
 
-        Args:
-            country: The country
-        """
-        self.country = country
-
-    def set_region(self, region: str) -> None:
-        """
-        Set the region.
-
-        Args:
-            region: The region
-        """
-        self.region = region
-
-    def set_pit_near_avalanche(self, pit_near_avalanche: bool) -> None:
-        """
-        Set whether the pit is near an avalanche.
-
-        Args:
-            pit_near_avalanche: Whether the pit is near an avalanche
-        """
-        self.pit_near_avalanche = pit_near_avalanche
-
-    def set_pit_near_avalanche_location(self, pit_near_avalanche_location: str) -> None:
-        """
-        Set the location of the pit relative to the avalanche.
-
-        Args:
-            pit_near_avalanche_location: The location of the pit relative to the
-                avalanche
-        """
-        self.pit_near_avalanche_location = pit_near_avalanche_location
-
-    def set_avalanche_initiation_height(
-        self, avalanche_initiation_height: Tuple[float, str]
-    ) -> None:
-        """
-        Set the height at which an avalanche initiation occurred.
-
-        Args:
-            avalanche_initiation_height: Height at which an avalanche initiation occurred
-                with unit (SLF)
-        """
-        self.avalanche_initiation_height = avalanche_initiation_height
-
-
-@dataclass
-class User:
+@slotted_dataclass
+class User(AsDict, LegacySetters):
     """
     User class for representing a Snow Pilot user.
 
@@ -294,67 +171,22 @@ class User:
 
     def __str__(self) -> str:
         """Return a string representation of the user."""
-        user_str = f"operation_id: {self.operation_id}\n"
-
-        if self.operation_name is not None:
-            user_str += f"operation_name: {self.operation_name}\n"
-
-        user_str += (
+        operation_name = (
+            f"operation_name: {self.operation_name}\n"
+            if self.operation_name is not None
+            else ""
+        )
+        return (
+            f"operation_id: {self.operation_id}\n"
+            f"{operation_name}"
             f"professional: {self.professional}\n"
             f"user_id: {self.user_id}\n"
             f"username: {self.username}\n"
         )
 
-        return user_str
-
-    def set_operation_id(self, operation_id: str) -> None:
-        """
-        Set the operation ID.
-
-        Args:
-            operation_id: The operation ID
-        """
-        self.operation_id = operation_id
-
-    def set_operation_name(self, operation_name: str) -> None:
-        """
-        Set the operation name.
-
-        Args:
-            operation_name: The operation name
-        """
-        self.operation_name = operation_name
 
-    def set_professional(self, professional: bool) -> None:
-        """
-        Set whether the user is a professional.
-
-        Args:
-            professional: Whether the user is a professional
-        """
-        self.professional = professional
-
-    def set_user_id(self, user_id: str) -> None:
-        """
-        Set the user ID.
-
-        Args:
-            user_id: The user ID
-        """
-        self.user_id = user_id
-
-    def set_username(self, username: str) -> None:
-        """
-        Set the username.
-
-        Args:
-            username: The username
-        """
-        self.username = username
-
-
-@dataclass
-class CoreInfo:
+@slotted_dataclass
+class CoreInfo(AsDict, LegacySetters):
     """
     CoreInfo class for representing a "core Info" from a Snowpilot XML file.
 
@@ -390,48 +222,3 @@ class CoreInfo:
             f"location: {self.location}\n"
             f"weather_conditions: {self.weather_conditions}\n"
         )
-
-    def set_pit_id(self, pit_id: str) -> None:
-        """
-        Set the pit ID.
-
-        Args:
-            pit_id: The pit ID
-        """
-        self.pit_id = pit_id
-
-    def set_pit_name(self, pit_name: str) -> None:
-        """
-        Set the pit name.
-
-        Args:
-            pit_name: The pit name
-        """
-        self.pit_name = pit_name
-
-    def set_date(self, date: str) -> None:
-        """
-        Set the date.
-
-        Args:
-            date: The date
-        """
-        self.date = date
-
-    def set_comment(self, comment: str) -> None:
-        """
-        Set the comment.
-
-        Args:
-            comment: The comment
-        """
-        self.comment = comment
-
-    def set_caaml_version(self, caaml_version: str) -> None:
-        """
-        Set the CAAML version.
-
-        Args:
-            caaml_version: The CAAML version
-        """
-        self.caaml_version = caaml_version
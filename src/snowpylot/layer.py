@@ -1,9 +1,113 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import sys
+from typing import Dict, Optional, Tuple
+
+from ._compat import AsDict, LegacySetters, slotted_dataclass
+
+# Basic grain class dictionary
+_BASIC_GRAIN_CLASS_DICT = {
+    "PP": "Precipitation particles",
+    "DF": "Decomposing and fragmented precipitation particles",
+    "RG": "Rounded grains",
+    "FC": "Faceted crystals",
+    "DH": "Depth hoar",
+    "SH": "Surface hoar",
+    "MF": "Melt forms",
+    "IF": "Ice formations",
+    "MM": "Machine made Snow",
+}
+
+# Sub grain class dictionary
+_SUB_GRAIN_CLASS_DICT = {
+    "PPgp": "Graupel",
+    "PPco": "Columns",
+    "PPhl": "Hail",
+    "PPpl": "Plates",
+    "PPnd": "Needles",
+    "PPsd": "Stellars, Dendrites",
+    "PPir": "Irregular crystals",
+    "PPip": "Ice pellets",
+    "PPrm": "Rime",
+    "DFdc": "Partly decomposed precipitation particles",
+    "DFbk": "Wind-broken precipitation particles",
+    "RGsr": "Small rounded particles",
+    "RGlr": "Large rounded particles",
+    "RGwp": "Wind packed",
+    "RGxf": "Faceted rounded particles",
+    "FCso": "Solid faceted particles",
+    "FCsf": "Near surface faceted particles",
+    "FCxr": "Rounding faceted particles",
+    "DHcp": "Hollow cups",
+    "DHpr": "Hollow prisms",
+    "DHch": "Chains of depth hoar",
+    "DHla": "Large striated crystals",
+    "DHxr": "Rounding depth hoar",
+    "SHsu": "Surface hoar crystals",
+    "SHcv": "Cavity or crevasse hoar",
+    "SHxr": "Rounding surface hoar",
+    "MFcl": "Clustered rounded grains",
+    "MFpc": "Rounded polycrystals",
+    "MFsl": "Slush",
+    "MFcr": "Melt-freeze crust",
+    "IFil": "Ice layer",
+    "IFic": "Ice column",
+    "IFbi": "Basal ice",
+    "IFrc": "Rain crust",
+    "IFsc": "Sun crust",
+    "MMrp": "Round polycrystalline particles",
+    "MMci": "Crushed ice particles",
+}
+
+# Wetness dictionary
+_WETNESS_DICT = {
+    "D": "Dry",
+    "D-M": "Dry to moist",
+    "M": "Moist",
+    "M-W": "Moist to wet",
+    "W": "Wet",
+    "W-VW": "Wet to very wet",
+    "VW": "Very wet",
+    "VW-S": "Very wet to slush",
+    "S": "Slush",
+}
+
+# Grain class codes and names derived from a grain form:
+# (basic code, basic name, sub code, sub name)
+_GrainClass = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+# The grain form vocabulary is small, so every distinct grain form is only split
+# and looked up once and all grains with that form share the result. The table
+# is seeded with the known codes below; unknown codes are added on first use.
+_GRAIN_CLASS_CACHE: Dict[str, _GrainClass] = {}
+
+
+def _classify_grain(grain_form: str) -> _GrainClass:
+    """
+    Return the basic and sub grain class codes and names for a grain form.
+
+    Args:
+        grain_form: The grain form code, e.g. "FC" or "FCxr"
+    """
+    grain_class = _GRAIN_CLASS_CACHE.get(grain_form)
+    if grain_class is None:
+        basic_code = sys.intern(grain_form[:2])
+        sub_code = grain_form if len(grain_form) > 2 else None
+        grain_class = (
+            basic_code,
+            _BASIC_GRAIN_CLASS_DICT.get(basic_code),
+            sub_code,
+            _SUB_GRAIN_CLASS_DICT.get(sub_code) if sub_code is not None else None,
+        )
+        _GRAIN_CLASS_CACHE[grain_form] = grain_class
+    return grain_class
+
 
+for _grain_form in (*_BASIC_GRAIN_CLASS_DICT, *_SUB_GRAIN_CLASS_DICT):
+    _classify_grain(_grain_form)
+del _grain_form
 
-@dataclass
-class Grain:
+
+@slotted_dataclass
+class Grain(AsDict, LegacySetters):
     """
     Grain class for representing a grain form in a snow layer.
 
@@ -11,19 +115,22 @@ class Grain:
         grain_form: The grain form code
         grain_size_avg: Average grain size with unit
         grain_size_max: Maximum grain size with unit
-        basic_grain_class_code: Basic grain class code
-        basic_grain_class_name: Basic grain class name
-        sub_grain_class_code: Sub grain class code
-        sub_grain_class_name: Sub grain class name
+        basic_grain_class_code: Basic grain class code (computed)
+        basic_grain_class_name: Basic grain class name (computed)
+        sub_grain_class_code: Sub grain class code (computed)
+        sub_grain_class_name: Sub grain class name (computed)
     """
 
+    _computed_fields = (
+        "basic_grain_class_code",
+        "basic_grain_class_name",
+        "sub_grain_class_code",
+        "sub_grain_class_name",
+    )
+
     grain_form: Optional[str] = None
     grain_size_avg: Optional[Tuple[float, str]] = None
     grain_size_max: Optional[Tuple[float, str]] = None
-    basic_grain_class_code: Optional[str] = None
-    basic_grain_class_name: Optional[str] = None
-    sub_grain_class_code: Optional[str] = None
-    sub_grain_class_name: Optional[str] = None
 
     def __str__(self) -> str:
         """Return a string representation of the grain."""
@@ -37,105 +144,37 @@ class Grain:
             f"\n\t\t sub_grain_class_name: {self.sub_grain_class_name}"
         )
 
-    def set_grain_form(self, grain_form: str) -> None:
-        """
-        Set the grain form and compute derived properties.
-
-        Args:
-            grain_form: The grain form code
-        """
-        self.grain_form = grain_form
-
-        # Basic grain class dictionary
-        basic_grain_class_dict = {
-            "PP": "Precipitation particles",
-            "DF": "Decomposing and fragmented precipitation particles",
-            "RG": "Rounded grains",
-            "FC": "Faceted crystals",
-            "DH": "Depth hoar",
-            "SH": "Surface hoar",
-            "MF": "Melt forms",
-            "IF": "Ice formations",
-            "MM": "Machine made Snow",
-        }
-
-        # Sub grain class dictionary
-        sub_grain_class_dict = {
-            "PPgp": "Graupel",
-            "PPco": "Columns",
-            "PPhl": "Hail",
-            "PPpl": "Plates",
-            "PPnd": "Needles",
-            "PPsd": "Stellars, Dendrites",
-            "PPir": "Irregular crystals",
-            "PPip": "Ice pellets",
-            "PPrm": "Rime",
-            "DFdc": "Partly decomposed precipitation particles",
-            "DFbk": "Wind-broken precipitation particles",
-            "RGsr": "Small rounded particles",
-            "RGlr": "Large rounded particles",
-            "RGwp": "Wind packed",
-            "RGxf": "Faceted rounded particles",
-            "FCso": "Solid faceted particles",
-            "FCsf": "Near surface faceted particles",
-            "FCxr": "Rounding faceted particles",
-            "DHcp": "Hollow cups",
-            "DHpr": "Hollow prisms",
-            "DHch": "Chains of depth hoar",
-            "DHla": "Large striated crystals",
-            "DHxr": "Rounding depth hoar",
-            "SHsu": "Surface hoar crystals",
-            "SHcv": "Cavity or crevasse hoar",
-            "SHxr": "Rounding surface hoar",
-            "MFcl": "Clustered rounded grains",
-            "MFpc": "Rounded polycrystals",
-            "MFsl": "Slush",
-            "MFcr": "Melt-freeze crust",
-            "IFil": "Ice layer",
-            "IFic": "Ice column",
-            "IFbi": "Basal ice",
-            "IFrc": "Rain crust",
-            "IFsc": "Sun crust",
-            "MMrp": "Round polycrystalline particles",
-            "MMci": "Crushed ice particles",
-        }
-
-        if len(grain_form) > 2:
-            self.basic_grain_class_code = grain_form[:2]
-            self.sub_grain_class_code = grain_form
-            self.basic_grain_class_name = basic_grain_class_dict.get(
-                self.basic_grain_class_code
-            )
-            self.sub_grain_class_name = sub_grain_class_dict.get(
-                self.sub_grain_class_code
-            )
-        else:
-            self.basic_grain_class_code = grain_form
-            self.basic_grain_class_name = basic_grain_class_dict.get(
-                self.basic_grain_class_code
-            )
-
-    def set_grain_size_avg(self, grain_size_avg: Tuple[float, str]) -> None:
-        """
-        Set the average grain size.
-
-        Args:
-            grain_size_avg: The average grain size with unit
-        """
-        self.grain_size_avg = grain_size_avg
-
-    def set_grain_size_max(self, grain_size_max: Tuple[float, str]) -> None:
-        """
-        Set the maximum grain size.
-
-        Args:
-            grain_size_max: The maximum grain size with unit
-        """
-        self.grain_size_max = grain_size_max
-
-
-@dataclass
-class Layer:
+    @property
+    def basic_grain_class_code(self) -> Optional[str]:
+        """Basic grain class code, e.g. "FC" for the grain form "FCxr"."""
+        if self.grain_form is None:
+            return None
+        return _classify_grain(self.grain_form)[0]
+
+    @property
+    def basic_grain_class_name(self) -> Optional[str]:
+        """Basic grain class name."""
+        if self.grain_form is None:
+            return None
+        return _classify_grain(self.grain_form)[1]
+
+    @property
+    def sub_grain_class_code(self) -> Optional[str]:
+        """Sub grain class code, only set for grain forms longer than two chars."""
+        if self.grain_form is None:
+            return None
+        return _classify_grain(self.grain_form)[2]
+
+    @property
+    def sub_grain_class_name(self) -> Optional[str]:
+        """Sub grain class name."""
+        if self.grain_form is None:
+            return None
+        return _classify_grain(self.grain_form)[3]
+
+
+@slotted_dataclass
+class Layer(AsDict, LegacySetters):
     """
     Layer class for representing a snow layer in a snow profile.
 
@@ -150,8 +189,11 @@ class Layer:
         wetness: Wetness of the layer
         layer_of_concern: Whether the layer is of concern
         comments: Comments about the layer
+        wetness_desc: Description of the wetness (computed)
     """
 
+    _computed_fields = ("wetness_desc",)
+
     depth_top: Optional[Tuple[float, str]] = None
     thickness: Optional[Tuple[float, str]] = None
     hardness: Optional[str] = None
@@ -163,9 +205,6 @@ class Layer:
     layer_of_concern: Optional[bool] = None
     comments: Optional[str] = None
 
-    # Computed properties
-    wetness_desc: Optional[str] = None
-
     def __str__(self) -> str:
         """Return a string representation of the layer."""
         return (
@@ -183,88 +222,9 @@ class Layer:
             f"\t comments: {self.comments}"
         )
 
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
-
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
-
-    def set_thickness(self, thickness: Tuple[float, str]) -> None:
-        """
-        Set the thickness of the layer.
-
-        Args:
-            thickness: The thickness with unit
-        """
-        self.thickness = thickness
-
-    def set_hardness(self, hardness: str) -> None:
-        """
-        Set the hardness of the layer.
-
-        Args:
-            hardness: The hardness
-        """
-        self.hardness = hardness
-
-    def set_hardness_top(self, hardness_top: str) -> None:
-        """
-        Set the hardness at the top of the layer.
-
-        Args:
-            hardness_top: The hardness at the top
-        """
-        self.hardness_top = hardness_top
-
-    def set_hardness_bottom(self, hardness_bottom: str) -> None:
-        """
-        Set the hardness at the bottom of the layer.
-
-        Args:
-            hardness_bottom: The hardness at the bottom
-        """
-        self.hardness_bottom = hardness_bottom
-
-    def set_wetness(self, wetness: str) -> None:
-        """
-        Set the wetness of the layer and compute the description.
-
-        Args:
-            wetness: The wetness
-        """
-        self.wetness = wetness
-
-        wetness_dict = {
-            "D": "Dry",
-            "D-M": "Dry to moist",
-            "M": "Moist",
-            "M-W": "Moist to wet",
-            "W": "Wet",
-            "W-VW": "Wet to very wet",
-            "VW": "Very wet",
-            "VW-S": "Very wet to slush",
-            "S": "Slush",
-        }
-
-        self.wetness_desc = wetness_dict.get(wetness)
-
-    def set_layer_of_concern(self, layer_of_concern: bool) -> None:
-        """
-        Set whether the layer is of concern.
-
-        Args:
-            layer_of_concern: Whether the layer is of concern
-        """
-        self.layer_of_concern = layer_of_concern
-
-    def set_comments(self, comments: str) -> None:
-        """
-        Set comments about the layer.
-
-        Args:
-            comments: The comments
-        """
-        self.comments = comments
+    @property
+    def wetness_desc(self) -> Optional[str]:
+        """Description of the wetness."""
+        if self.wetness is None:
+            return None
+        return _WETNESS_DICT.get(self.wetness)
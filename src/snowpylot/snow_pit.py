@@ -1,13 +1,14 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 
+from ._compat import AsDict, slotted_dataclass
 from .core_info import CoreInfo
 from .snow_profile import SnowProfile
 from .stability_tests import StabilityTests
 from .whumpf_data import WhumpfData
 
 
-@dataclass
-class SnowPit:
+@slotted_dataclass
+class SnowPit(AsDict):
     """
     SnowPit class for representing a single snow pit observation.
 
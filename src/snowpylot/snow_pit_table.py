@@ -0,0 +1,277 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .caaml_parser import caaml_parser
+from .snow_pit import SnowPit
+
+_NAN = float("nan")
+
+# Factors converting a parsed elevation unit to metres
+_TO_METRES = {"m": 1.0, "ft": 0.3048}
+
+# Codes of the eight compass aspects, stored in the aspect_code column
+ASPECT_CODES = {"N": 0, "NE": 1, "E": 2, "SE": 3, "S": 4, "SW": 5, "W": 6, "NW": 7}
+
+# aspect_code of a missing or non-compass aspect
+_NO_ASPECT = -1
+
+
+def _metres(value) -> float:
+    """Return an [elevation, uom] value in metres, or NaN if missing/unknown"""
+    if value is None or value[1] not in _TO_METRES:
+        return _NAN
+    return float(value[0]) * _TO_METRES[value[1]]
+
+
+def _degrees(value) -> float:
+    """Return a [slope_angle, uom] value in degrees, or NaN if missing/unknown"""
+    if value is None or value[1] != "deg" or not value[0]:
+        return _NAN
+    return float(value[0])
+
+
+def _aspect_code(aspect: Optional[str]) -> int:
+    """Return the code of a compass aspect, or -1 if missing/unknown"""
+    if aspect is None:
+        return _NO_ASPECT
+    return ASPECT_CODES.get(aspect, _NO_ASPECT)
+
+
+def _float32(value: float) -> float:
+    """Return a value rounded to float32, the precision of the float32 columns"""
+    return array("f", [value])[0]
+
+
+def _float(value: Optional[float]) -> float:
+    """Return a float value, or NaN if missing"""
+    return _NAN if value is None else value
+
+
+class SnowPitTable:
+    """
+    SnowPitTable class for a column-oriented view of many snow pits.
+
+    Every column holds one entry per pit, in the order the pits were given.
+    Numeric columns are ``array.array`` objects using NaN for missing values;
+    coordinates are float64 and the other measurements float32, which is
+    plenty for metre and degree resolution. The arrays support the buffer
+    protocol, so ``numpy.asarray`` wraps them without copying. Aspects are
+    also stored as small integer codes (see ``ASPECT_CODES``, -1 if missing),
+    which filters compare instead of strings. Filtering scans the columns and
+    only looks up the matching SnowPit objects at the end.
+
+    The columns are meant to be read and must not be changed directly: pass
+    pits to the constructor or add rows with :meth:`add_pit`, which keeps the
+    columns the same length and resets the cached latitude index.
+
+    Attributes:
+        pits: The snow pits, in table order
+        pit_id: Pit IDs
+        date: Observation dates
+        country: Countries
+        region: Regions
+        aspect: Aspects
+        aspect_code: Aspect codes from ``ASPECT_CODES``
+        latitude: Latitudes in decimal degrees
+        longitude: Longitudes in decimal degrees
+        elevation: Elevations in metres (float32)
+        slope_angle: Slope angles in degrees (float32)
+    """
+
+    def __init__(self, pits: Iterable[SnowPit] = ()) -> None:
+        """
+        Build a table holding the given snow pits.
+
+        Args:
+            pits: The snow pits to add to the table
+        """
+        self.pits: List[SnowPit] = []
+        self.pit_id: List[Optional[str]] = []
+        self.date: List[Optional[str]] = []
+        self.country: List[Optional[str]] = []
+        self.region: List[Optional[str]] = []
+        self.aspect: List[Optional[str]] = []
+        self.aspect_code = array("b")
+        self.latitude = array("d")
+        self.longitude = array("d")
+        self.elevation = array("f")
+        self.slope_angle = array("f")
+
+        # Latitudes sorted ascending and their row indices, built on first use
+        # and reset by add_pit
+        self._latitude_index: Optional[Tuple[List[float], List[int]]] = None
+
+        for pit in pits:
+            self.add_pit(pit)
+
+    def __str__(self) -> str:
+        """Return a string representation of the snow pit table."""
+        return f"SnowPitTable: {len(self)} pits"
+
+    def __len__(self) -> int:
+        """Return the number of pits in the table."""
+        return len(self.pits)
+
+    @classmethod
+    def from_pits(cls, pits: Iterable[SnowPit]) -> "SnowPitTable":
+        """
+        Build a table from parsed snow pits.
+
+        Args:
+            pits: The snow pits to add to the table
+        """
+        return cls(pits)
+
+    @classmethod
+    def from_files(
+        cls, file_paths: Iterable[str], workers: int = 1, chunksize: int = 16
+    ) -> "SnowPitTable":
+        """
+        Build a table by parsing SnowPilot caaml.xml files.
+
+        Files are independent, so with ``workers`` > 1 they are parsed in a pool
+        of that many processes. Rows keep the order of ``file_paths``.
+
+        On macOS and Windows worker processes are started with the "spawn"
+        method, which re-imports the calling script. Call ``from_files`` with
+        ``workers`` > 1 from code guarded by ``if __name__ == "__main__":`` there,
+        otherwise starting the pool fails with a RuntimeError.
+
+        Args:
+            file_paths: Paths to the caaml.xml files to parse
+            workers: Number of processes used to parse the files
+            chunksize: Number of files sent to a worker process at a time
+        """
+        if workers <= 1:
+            return cls.from_pits(caaml_parser(file_path) for file_path in file_paths)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return cls.from_pits(
+                executor.map(caaml_parser, file_paths, chunksize=chunksize)
+            )
+
+    def add_pit(self, pit: SnowPit) -> None:
+        """
+        Add a snow pit as a new row of the table.
+
+        Args:
+            pit: The snow pit to add
+        """
+        core_info = pit.core_info
+        location = core_info.location
+
+        self.pits.append(pit)
+        self.pit_id.append(core_info.pit_id)
+        self.date.append(core_info.date)
+        self.country.append(location.country)
+        self.region.append(location.region)
+        self.aspect.append(location.aspect)
+        self.aspect_code.append(_aspect_code(location.aspect))
+        self.latitude.append(_float(location.latitude))
+        self.longitude.append(_float(location.longitude))
+        self.elevation.append(_metres(location.elevation))
+        self.slope_angle.append(_degrees(location.slope_angle))
+        self._latitude_index = None
+
+    def _rows_in_latitude_range(
+        self, latitude_min: Optional[float], latitude_max: Optional[float]
+    ) -> List[int]:
+        """
+        Return the rows with a latitude inside the given range, in row order.
+
+        Uses a latitude-sorted index so only the matching rows are visited.
+        """
+        if self._latitude_index is None:
+            order = sorted(
+                (i for i, lat in enumerate(self.latitude) if not math.isnan(lat)),
+                key=self.latitude.__getitem__,
+            )
+            self._latitude_index = ([self.latitude[i] for i in order], order)
+
+        latitudes, order = self._latitude_index
+        start = 0 if latitude_min is None else bisect_left(latitudes, latitude_min)
+        stop = (
+            len(latitudes)
+            if latitude_max is None
+            else bisect_right(latitudes, latitude_max)
+        )
+        return sorted(order[start:stop])
+
+    def indices(
+        self,
+        country: Optional[str] = None,
+        region: Optional[str] = None,
+        aspect: Optional[str] = None,
+        elevation_min: Optional[float] = None,
+        elevation_max: Optional[float] = None,
+        latitude_min: Optional[float] = None,
+        latitude_max: Optional[float] = None,
+        longitude_min: Optional[float] = None,
+        longitude_max: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Return the row indices of the pits matching all given criteria.
+
+        Criteria left as None are ignored. Pits with a missing value never match
+        a criterion on that column.
+
+        Args:
+            country: Country the pit must be in
+            region: Region the pit must be in
+            aspect: Aspect of the pit
+            elevation_min: Minimum elevation in metres
+            elevation_max: Maximum elevation in metres
+            latitude_min: Southern edge of the bounding box
+            latitude_max: Northern edge of the bounding box
+            longitude_min: Western edge of the bounding box
+            longitude_max: Eastern edge of the bounding box
+        """
+        # Each criterion only scans the rows that survived the previous ones
+        rows: Sequence[int] = range(len(self.pits))
+
+        if latitude_min is not None or latitude_max is not None:
+            rows = self._rows_in_latitude_range(latitude_min, latitude_max)
+
+        for column, value in (
+            (self.country, country),
+            (self.region, region),
+        ):
+            if value is not None:
+                rows = [i for i in rows if column[i] == value]
+
+        if aspect is not None:
+            code = ASPECT_CODES.get(aspect)
+            if code is None:
+                rows = [i for i in rows if self.aspect[i] == aspect]
+            else:
+                aspect_code = self.aspect_code
+                rows = [i for i in rows if aspect_code[i] == code]
+
+        # Bounds are rounded like the float32 values so inclusive bounds match
+        elevation = self.elevation
+        if elevation_min is not None:
+            elevation_min = _float32(elevation_min)
+            rows = [i for i in rows if elevation[i] >= elevation_min]
+        if elevation_max is not None:
+            elevation_max = _float32(elevation_max)
+            rows = [i for i in rows if elevation[i] <= elevation_max]
+
+        longitude = self.longitude
+        if longitude_min is not None:
+            rows = [i for i in rows if longitude[i] >= longitude_min]
+        if longitude_max is not None:
+            rows = [i for i in rows if longitude[i] <= longitude_max]
+
+        return list(rows)
+
+    def filter(self, **criteria) -> List[SnowPit]:
+        """
+        Return the pits matching all given criteria.
+
+        Accepts the same keyword arguments as :meth:`indices`.
+        """
+        return [self.pits[i] for i in self.indices(**criteria)]
@@ -1,11 +1,51 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from array import array
+from dataclasses import field
+from typing import Callable, Iterable, List, Optional, Tuple
 
+from ._compat import AsDict, LegacySetters, slotted_dataclass
 from .layer import Layer
 
+_NAN = float("nan")
 
-@dataclass
-class SurfaceCondition:
+# Factors converting a parsed depth unit to centimetres
+_TO_CM = {"cm": 1.0, "mm": 0.1, "m": 100.0, "in": 2.54}
+
+
+def _cm(value: Optional[Tuple[float, str]]) -> float:
+    """Return a [depth, uom] value in cm, or NaN if missing/unknown"""
+    if value is None or value[1] not in _TO_CM:
+        return _NAN
+    return value[0] * _TO_CM[value[1]]
+
+
+def _deg_c(value: Optional[Tuple[float, str]]) -> float:
+    """Return a [temperature, uom] value in degC, or NaN if missing/unknown"""
+    if value is None:
+        return _NAN
+    if value[1] == "degC":
+        return value[0]
+    if value[1] == "degF":
+        return (value[0] - 32.0) * 5.0 / 9.0
+    return _NAN
+
+
+def _kg_m3(value: Optional[Tuple[float, str]]) -> float:
+    """Return a [density, uom] value in kg/m3, or NaN if missing/unknown"""
+    if value is None or value[1] != "kgm-3":
+        return _NAN
+    return value[0]
+
+
+def _column(
+    values: Iterable[Optional[Tuple[float, str]]],
+    convert: Callable[[Optional[Tuple[float, str]]], float],
+) -> array:
+    """Return [value, uom] values converted to one unit as a float32 array"""
+    return array("f", (convert(value) for value in values))
+
+
+@slotted_dataclass
+class SurfaceCondition(AsDict, LegacySetters):
     """
     SurfaceCondition class for representing the surface condition of a snow profile.
 
@@ -27,36 +67,9 @@ class SurfaceCondition:
             f"\n\t penetration_ski: {self.penetration_ski}"
         )
 
-    def set_wind_loading(self, wind_loading: str) -> None:
-        """
-        Set the wind loading.
-
-        Args:
-            wind_loading: The wind loading
-        """
-        self.wind_loading = wind_loading
-
-    def set_penetration_foot(self, penetration_foot: Tuple[float, str]) -> None:
-        """
-        Set the penetration of foot.
 
-        Args:
-            penetration_foot: The penetration of foot with unit
-        """
-        self.penetration_foot = penetration_foot
-
-    def set_penetration_ski(self, penetration_ski: Tuple[float, str]) -> None:
-        """
-        Set the penetration of ski.
-
-        Args:
-            penetration_ski: The penetration of ski with unit
-        """
-        self.penetration_ski = penetration_ski
-
-
-@dataclass
-class TempObs:
+@slotted_dataclass
+class TempObs(AsDict, LegacySetters):
     """
     TempObs class for representing a temperature observation.
 
@@ -72,27 +85,9 @@ class TempObs:
         """Return a string representation of the temperature observation."""
         return f"\n\t depth: {self.depth}\n\t snow_temp: {self.snow_temp}"
 
-    def set_depth(self, depth: Tuple[float, str]) -> None:
-        """
-        Set the depth.
-
-        Args:
-            depth: The depth with unit
-        """
-        self.depth = depth
 
-    def set_snow_temp(self, snow_temp: Tuple[float, str]) -> None:
-        """
-        Set the snow temperature.
-
-        Args:
-            snow_temp: The snow temperature with unit
-        """
-        self.snow_temp = snow_temp
-
-
-@dataclass
-class DensityObs:
+@slotted_dataclass
+class DensityObs(AsDict, LegacySetters):
     """
     DensityObs class for representing a density observation.
 
@@ -114,36 +109,9 @@ class DensityObs:
             f"\n\t density: {self.density}"
         )
 
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
-
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
-
-    def set_thickness(self, thickness: Tuple[float, str]) -> None:
-        """
-        Set the thickness of the layer.
-
-        Args:
-            thickness: The thickness with unit
-        """
-        self.thickness = thickness
-
-    def set_density(self, density: Tuple[float, str]) -> None:
-        """
-        Set the density.
-
-        Args:
-            density: The density with unit
-        """
-        self.density = density
-
 
-@dataclass
-class SnowProfile:
+@slotted_dataclass
+class SnowProfile(AsDict, LegacySetters):
     """
     SnowProfile class for representing a snow profile.
 
@@ -157,6 +125,12 @@ class SnowProfile:
         temp_profile: List of temperature observations
         density_profile: List of density observations
         layer_of_concern: Layer of concern
+
+    The numeric fields of the layers and observations are also available as
+    float32 ``array.array`` columns from the ``*_column`` methods. They hold
+    depths in cm, temperatures in degC and densities in kg/m3, with NaN for
+    missing values or unknown units. Each call builds a new array from the
+    lists, so call a method once and index the result.
     """
 
     # Parsed properties
@@ -173,67 +147,75 @@ class SnowProfile:
 
     def __str__(self) -> str:
         """Return a string representation of the snow profile."""
-        snow_profile_str = (
+        parts = [
             f"\n    measurement_direction: {self.measurement_direction}"
             f"\n    profile_depth: {self.profile_depth}"
             f"\n    hs: {self.hs}"
             f"\n    surf_cond: {self.surf_cond}"
             f"\n    Layers:"
+        ]
+        parts.extend(
+            f"\n    Layer {i}: {layer}" for i, layer in enumerate(self.layers, 1)
         )
 
-        if self.layers:
-            for i, layer in enumerate(self.layers):
-                snow_profile_str += f"\n    Layer {i + 1}: {layer}"
-
-        snow_profile_str += "\n    temp_profile:"
-        if self.temp_profile:
-            for i, temp in enumerate(self.temp_profile):
-                snow_profile_str += f"\n    temp {i + 1}: {temp}"
+        parts.append("\n    temp_profile:")
+        parts.extend(
+            f"\n    temp {i}: {temp}" for i, temp in enumerate(self.temp_profile, 1)
+        )
 
-        snow_profile_str += "\n    density_profile:"
-        if self.density_profile:
-            for i, density in enumerate(self.density_profile):
-                snow_profile_str += f"\n    density {i + 1}: {density}"
+        parts.append("\n    density_profile:")
+        parts.extend(
+            f"\n    density {i}: {density}"
+            for i, density in enumerate(self.density_profile, 1)
+        )
 
-        snow_profile_str += f"\n    layer_of_concern: {self.layer_of_concern}"
+        parts.append(f"\n    layer_of_concern: {self.layer_of_concern}")
 
-        return snow_profile_str
+        return "".join(parts)
 
-    def set_measurement_direction(self, measurement_direction: str) -> None:
-        """
-        Set the measurement direction.
+    def layer_depth_column(self) -> array:
+        """Return the depth to the top of each layer in cm, as a new array."""
+        return _column((layer.depth_top for layer in self.layers), _cm)
 
-        Args:
-            measurement_direction: The measurement direction
-        """
-        self.measurement_direction = measurement_direction
+    def layer_thickness_column(self) -> array:
+        """Return the thickness of each layer in cm, as a new array."""
+        return _column((layer.thickness for layer in self.layers), _cm)
 
-    def set_profile_depth(self, profile_depth: Tuple[float, str]) -> None:
-        """
-        Set the profile depth.
+    def temp_depth_column(self) -> array:
+        """Return the depth of each temperature observation in cm, as a new array."""
+        return _column((temp.depth for temp in self.temp_profile), _cm)
 
-        Args:
-            profile_depth: The profile depth with unit
-        """
-        self.profile_depth = profile_depth
+    def temp_column(self) -> array:
+        """Return the snow temperature of each observation in degC, as a new array."""
+        return _column((temp.snow_temp for temp in self.temp_profile), _deg_c)
 
-    def set_hs(self, hs: Tuple[float, str]) -> None:
-        """
-        Set the snow height.
+    def density_depth_column(self) -> array:
+        """Return the depth to the top of each density layer in cm, as a new array."""
+        return _column((density.depth_top for density in self.density_profile), _cm)
 
-        Args:
-            hs: The snow height with unit
-        """
-        self.hs = hs
+    def density_column(self) -> array:
+        """Return the density of each density observation in kg/m3, as a new array."""
+        return _column((density.density for density in self.density_profile), _kg_m3)
 
-    def set_surf_cond(self, surf_cond: SurfaceCondition) -> None:
+    def temp_gradient(self) -> array:
         """
-        Set the surface condition.
+        Return the temperature gradient between consecutive temperature observations.
 
-        Args:
-            surf_cond: The surface condition
+        Entry i is the change in snow temperature in degC per cm of depth
+        between observations i and i + 1, so the result has one entry less than
+        ``temp_profile``. Pairs at the same depth give NaN.
         """
-        self.surf_cond = surf_cond
+        depths = self.temp_depth_column()
+        temps = self.temp_column()
+        return array(
+            "f",
+            (
+                (temps[i + 1] - temps[i]) / (depths[i + 1] - depths[i])
+                if depths[i + 1] != depths[i]
+                else _NAN
+                for i in range(len(depths) - 1)
+            ),
+        )
 
     def add_layer(self, layer: Layer) -> None:
         """
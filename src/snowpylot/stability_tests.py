@@ -1,9 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Optional, Tuple
 
+from ._compat import AsDict, LegacySetters, slotted_dataclass
 
-@dataclass
-class ExtColumnTest:
+
+@slotted_dataclass
+class ExtColumnTest(AsDict, LegacySetters):
     """
     ExtColumnTest class for representing results of ExtColumnTest stability test.
 
@@ -11,19 +13,16 @@ class ExtColumnTest:
         depth_top: Depth from the surface to the top of the layer with unit
         test_score: Test score
         comment: Comment
-        propagation: Whether the test propagated
-        num_taps: Number of taps
+        propagation: Whether the test propagated (computed)
+        num_taps: Number of taps (computed)
     """
 
-    # Parsed Properties
+    _computed_fields = ("propagation", "num_taps")
+
     depth_top: Optional[Tuple[float, str]] = None
     test_score: Optional[str] = None
     comment: Optional[str] = None
 
-    # Computed Properties
-    propagation: Optional[bool] = None
-    num_taps: Optional[str] = None
-
     def __str__(self) -> str:
         """Return a string representation of the extended column test."""
         return (
@@ -34,43 +33,23 @@ class ExtColumnTest:
             f"\n\t num_taps: {self.num_taps}"
         )
 
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
+    @property
+    def propagation(self) -> Optional[bool]:
+        """Whether the test propagated, e.g. True for the score "ECTP12"."""
+        if not self.test_score or len(self.test_score) <= 4:
+            return None
+        return self.test_score[3] == "P"
 
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
+    @property
+    def num_taps(self) -> Optional[str]:
+        """Number of taps, e.g. "12" for the score "ECTP12"."""
+        if not self.test_score or len(self.test_score) <= 4:
+            return None
+        return self.test_score[4:]
 
-    def set_test_score(self, test_score: str) -> None:
-        """
-        Set the test score and compute derived properties.
 
-        Args:
-            test_score: The test score
-        """
-        self.test_score = test_score
-
-        if test_score and len(test_score) > 4:
-            prop_char = test_score[3]
-            self.propagation = prop_char == "P"
-
-            num_taps = test_score[4:]
-            self.num_taps = num_taps
-
-    def set_comment(self, comment: str) -> None:
-        """
-        Set the comment.
-
-        Args:
-            comment: The comment
-        """
-        self.comment = comment
-
-
-@dataclass
-class ComprTest:
+@slotted_dataclass
+class ComprTest(AsDict, LegacySetters):
     """
     ComprTest class for representing results of a Compression Test stability test.
 
@@ -95,45 +74,9 @@ class ComprTest:
             f"\n\t comment: {self.comment}"
         )
 
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
-
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
-
-    def set_fracture_character(self, fracture_character: str) -> None:
-        """
-        Set the fracture character.
 
-        Args:
-            fracture_character: The fracture character
-        """
-        self.fracture_character = fracture_character
-
-    def set_test_score(self, test_score: str) -> None:
-        """
-        Set the test score.
-
-        Args:
-            test_score: The test score
-        """
-        self.test_score = test_score
-
-    def set_comment(self, comment: str) -> None:
-        """
-        Set the comment.
-
-        Args:
-            comment: The comment
-        """
-        self.comment = comment
-
-
-@dataclass
-class RBlockTest:
+@slotted_dataclass
+class RBlockTest(AsDict, LegacySetters):
     """
     RBlockTest class for representing results of a Rutschblock Test.
 
@@ -161,54 +104,9 @@ class RBlockTest:
             f"\n\t comment: {self.comment}"
         )
 
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
-
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
-
-    def set_fracture_character(self, fracture_character: str) -> None:
-        """
-        Set the fracture character.
-
-        Args:
-            fracture_character: The fracture character
-        """
-        self.fracture_character = fracture_character
-
-    def set_release_type(self, release_type: str) -> None:
-        """
-        Set the release type.
-
-        Args:
-            release_type: The release type
-        """
-        self.release_type = release_type
-
-    def set_test_score(self, test_score: str) -> None:
-        """
-        Set the test score.
-
-        Args:
-            test_score: The test score
-        """
-        self.test_score = test_score
-
-    def set_comment(self, comment: str) -> None:
-        """
-        Set the comment.
-
-        Args:
-            comment: The comment
-        """
-        self.comment = comment
 
-
-@dataclass
-class PropSawTest:
+@slotted_dataclass
+class PropSawTest(AsDict, LegacySetters):
     """
     PropSawTest class for representing results of a Propagation Saw Test.
 
@@ -239,63 +137,9 @@ class PropSawTest:
             f"\n\t comment: {self.comment}"
         )
 
-    def set_failure(self, failure: bool) -> None:
-        """
-        Set whether the test failed.
-
-        Args:
-            failure: Whether the test failed
-        """
-        self.failure = failure
-
-    def set_depth_top(self, depth_top: Tuple[float, str]) -> None:
-        """
-        Set the depth from the surface to the top of the layer.
-
-        Args:
-            depth_top: The depth with unit
-        """
-        self.depth_top = depth_top
-
-    def set_comment(self, comment: str) -> None:
-        """
-        Set the comment.
 
-        Args:
-            comment: The comment
-        """
-        self.comment = comment
-
-    def set_fracture_prop(self, fracture_prop: str) -> None:
-        """
-        Set the fracture propagation.
-
-        Args:
-            fracture_prop: The fracture propagation
-        """
-        self.fracture_prop = fracture_prop
-
-    def set_cut_length(self, cut_length: Tuple[float, str]) -> None:
-        """
-        Set the cut length.
-
-        Args:
-            cut_length: The cut length with unit
-        """
-        self.cut_length = cut_length
-
-    def set_column_length(self, column_length: Tuple[float, str]) -> None:
-        """
-        Set the column length.
-
-        Args:
-            column_length: The column length with unit
-        """
-        self.column_length = column_length
-
-
-@dataclass
-class StabilityTests:
+@slotted_dataclass
+class StabilityTests(AsDict):
     """
     StabilityTests class for representing stability tests from a SnowPilot
     caaml.xml file.
@@ -314,21 +158,16 @@ class StabilityTests:
 
     def __str__(self) -> str:
         """Return a string representation of the stability tests."""
-        stb_tests_str = ""
-
-        for i, ect_test in enumerate(self.ECT):
-            stb_tests_str += f"\n    ExtColumnTest {i + 1}: {ect_test}"
-
-        for i, ct_test in enumerate(self.CT):
-            stb_tests_str += f"\n    CompressionTest {i + 1}: {ct_test}"
-
-        for i, rblock_test in enumerate(self.RBlock):
-            stb_tests_str += f"\n    RutschblockTest {i + 1}: {rblock_test}"
-
-        for i, pst_test in enumerate(self.PST):
-            stb_tests_str += f"\n    PropSawTest {i + 1}: {pst_test}"
-
-        return stb_tests_str
+        parts: List[str] = []
+        for name, tests in (
+            ("ExtColumnTest", self.ECT),
+            ("CompressionTest", self.CT),
+            ("RutschblockTest", self.RBlock),
+            ("PropSawTest", self.PST),
+        ):
+            parts.extend(f"\n    {name} {i}: {test}" for i, test in enumerate(tests, 1))
+
+        return "".join(parts)
 
     def add_ect(self, ect: ExtColumnTest) -> None:
         """
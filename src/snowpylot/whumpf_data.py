@@ -1,9 +1,10 @@
-from dataclasses import dataclass
 from typing import Optional
 
+from ._compat import AsDict, LegacySetters, slotted_dataclass
 
-@dataclass
-class WhumpfData:
+
+@slotted_dataclass
+class WhumpfData(AsDict, LegacySetters):
     """
     WhumpfData class for representing custom whumpf data.
 
@@ -36,31 +37,3 @@ class WhumpfData:
             f"\n\t whumpf_triggered_remote_ava: {self.whumpf_triggered_remote_ava}"
             f"\n\t whumpf_size: {self.whumpf_size}"
         )
-
-    def set_whumpf_cracking(self, whumpf_cracking: str) -> None:
-        """Set the whumpf cracking value."""
-        self.whumpf_cracking = whumpf_cracking
-
-    def set_whumpf_no_cracking(self, whumpf_no_cracking: str) -> None:
-        """Set the whumpf no cracking value."""
-        self.whumpf_no_cracking = whumpf_no_cracking
-
-    def set_cracking_no_whumpf(self, cracking_no_whumpf: str) -> None:
-        """Set the cracking no whumpf value."""
-        self.cracking_no_whumpf = cracking_no_whumpf
-
-    def set_whumpf_near_pit(self, whumpf_near_pit: str) -> None:
-        """Set the whumpf near pit value."""
-        self.whumpf_near_pit = whumpf_near_pit
-
-    def set_whumpf_depth_weak_layer(self, whumpf_depth_weak_layer: str) -> None:
-        """Set the whumpf depth weak layer value."""
-        self.whumpf_depth_weak_layer = whumpf_depth_weak_layer
-
-    def set_whumpf_triggered_remote_ava(self, whumpf_triggered_remote_ava: str) -> None:
-        """Set the whumpf triggered remote avalanche value."""
-        self.whumpf_triggered_remote_ava = whumpf_triggered_remote_ava
-
-    def set_whumpf_size(self, whumpf_size: str) -> None:
-        """Set the whumpf size value."""
-        self.whumpf_size = whumpf_size
@@ -0,0 +1,55 @@
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from snowpylot._compat import LegacySetters, _add_slots
+
+
+class Record(LegacySetters):
+    """Dataclass used to test the pre-3.10 slots backport"""
+
+    name: Optional[str] = None
+    values: List[float] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.values)
+
+
+UnslottedRecord = Record
+Record = _add_slots(dataclass(Record))
+
+
+def test_add_slots():
+    """Test that the backport stores fields in slots and keeps dataclass behavior"""
+    record = Record(name="a")
+    assert not hasattr(record, "__dict__")
+    assert Record.__slots__ == ("name", "values")
+    assert Record is not UnslottedRecord
+
+    assert record.name == "a"
+    assert record.values == []
+    assert Record().name is None
+    assert Record().values is not record.values
+
+    record.values.append(1.0)
+    assert record.count == 1
+    assert record == Record(name="a", values=[1.0])
+    assert pickle.loads(pickle.dumps(record)) == record
+
+    with pytest.raises(AttributeError):
+        record.other = 1
+
+    with pytest.warns(DeprecationWarning):
+        record.set_name("b")
+    assert record.name == "b"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
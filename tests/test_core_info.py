@@ -66,6 +66,8 @@ def test_weather_conditions(test_pit):
     assert weather.air_temp_pres == [28.0, "degC"]
     assert weather.wind_speed == "C"
     assert weather.wind_dir == "SW"
+    assert weather.sky_cond_desc == "Scattered"
+    assert weather.wind_speed_desc == "Calm"
 
 
 def test_professional_user():
@@ -89,6 +91,25 @@ def test_missing_optional_fields(test_pit):
     assert core_info.user.professional is False  # default value
 
 
+def test_deprecated_setters(test_pit):
+    """Test that the removed set_* methods still assign fields with a warning"""
+    location = test_pit.core_info.location
+    with pytest.warns(DeprecationWarning, match="assign Location.country directly"):
+        location.set_country("CA")
+    assert location.country == "CA"
+
+    weather = test_pit.core_info.weather_conditions
+    with pytest.warns(DeprecationWarning):
+        weather.set_sky_cond("OVC")
+    assert weather.sky_cond_desc == "Overcast"
+
+    # Computed properties and unknown names have no setter
+    with pytest.raises(AttributeError):
+        weather.set_sky_cond_desc("Overcast")
+    with pytest.raises(AttributeError):
+        _ = location.missing_attribute
+
+
 def test_string_representation(test_pit):
     """Test string representation of CoreInfo objects"""
     core_info = test_pit.core_info
@@ -108,6 +129,7 @@ def test_string_representation(test_pit):
     location_str = str(core_info.location)
     assert "latitude: 45.828056" in location_str
     assert "longitude: -110.932875" in location_str
+    assert "\n\t pit_near_avalanche_location: crown" in location_str
 
     weather_str = str(core_info.weather_conditions)
     assert "sky_cond: SCT" in weather_str
@@ -0,0 +1,128 @@
+import math
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from snowpylot.caaml_parser import caaml_parser
+from snowpylot.snow_pit import SnowPit
+from snowpylot.snow_pit_table import SnowPitTable
+
+TEST_FILES = [
+    "demos/snowpits/test/mkc_TESTPIT-23-Feb-caaml.xml",
+    "demos/snowpits/test/snowpits-13720-caaml.xml",
+    "demos/snowpits/test/snowpits-25670-wumph-caaml.xml",
+    "demos/snowpits/test/snowpylot-test-26-Feb-caaml.xml",
+]
+
+
+@pytest.fixture
+def test_table():
+    """Fixture building a table from the test snowpit files"""
+    return SnowPitTable.from_pits(caaml_parser(file) for file in TEST_FILES)
+
+
+def test_table_columns(test_table):
+    """Test that every column has one entry per pit"""
+    assert len(test_table) == 4
+    assert test_table.pit_id == ["72805", "13720", "25670", "73109"]
+    assert test_table.country == ["US", "US", "US", "US"]
+    assert test_table.region == ["MT", "MT", "CO", "MT"]
+    assert test_table.aspect == ["NE", "NE", "E", "NE"]
+    assert list(test_table.aspect_code) == [1, 1, 2, 1]
+    assert list(test_table.elevation) == [2134.0, 2598.0, 3642.0, 2598.0]
+    assert list(test_table.slope_angle) == [32.0, 30.0, 25.0, 30.0]
+    assert test_table.latitude[3] == 45.828056
+
+
+def test_from_files(test_table):
+    """Test building a table directly from caaml.xml files"""
+    table = SnowPitTable.from_files(TEST_FILES)
+    assert table.pit_id == test_table.pit_id
+    assert table.region == test_table.region
+
+    parallel_table = SnowPitTable.from_files(TEST_FILES, workers=2, chunksize=1)
+    assert parallel_table.pit_id == test_table.pit_id
+    assert list(parallel_table.elevation) == list(test_table.elevation)
+
+
+def test_constructor(test_table):
+    """Test that a table built with the constructor fills every column"""
+    table = SnowPitTable(test_table.pits)
+    assert len(table) == 4
+    assert table.pit_id == test_table.pit_id
+    assert list(table.elevation) == list(test_table.elevation)
+    assert table.indices(region="MT") == [0, 1, 3]
+    assert table.indices(latitude_min=45.82) == [1, 3]
+
+    assert len(SnowPitTable()) == 0
+    assert SnowPitTable().indices(region="MT") == []
+
+
+def test_missing_values_are_nan(test_table):
+    """Test that missing numeric values are stored as NaN"""
+    assert math.isnan(test_table.latitude[2])
+    assert math.isnan(test_table.longitude[2])
+
+    empty_table = SnowPitTable.from_pits([SnowPit()])
+    assert empty_table.pit_id == [None]
+    assert math.isnan(empty_table.elevation[0])
+    assert math.isnan(empty_table.slope_angle[0])
+    assert list(empty_table.aspect_code) == [-1]
+
+
+def test_indices(test_table):
+    """Test filtering rows by column criteria"""
+    assert test_table.indices() == [0, 1, 2, 3]
+    assert test_table.indices(region="MT") == [0, 1, 3]
+    assert test_table.indices(region="MT", elevation_min=2500) == [1, 3]
+    assert test_table.indices(aspect="E", elevation_max=3000) == []
+    assert test_table.indices(country="CA") == []
+    assert test_table.indices(aspect="NE") == [0, 1, 3]
+    assert test_table.indices(aspect="Flat") == []
+
+
+def test_elevation_bounds_are_inclusive():
+    """Test that non-integral elevations match bounds equal to them"""
+    metres = SnowPit()
+    metres.core_info.location.elevation = [2133.6, "m"]
+    feet = SnowPit()
+    feet.core_info.location.elevation = [7000.0, "ft"]
+    table = SnowPitTable.from_pits([metres, feet])
+
+    assert table.indices(elevation_min=2133.6, elevation_max=2133.6) == [0, 1]
+    assert table.indices(elevation_max=2133.5) == []
+
+
+def test_bounding_box(test_table):
+    """Test filtering rows by a latitude/longitude bounding box"""
+    assert test_table.indices(latitude_min=45.8, latitude_max=45.9) == [0, 1, 3]
+    assert test_table.indices(latitude_min=45.82) == [1, 3]
+    assert test_table.indices(latitude_max=45.82) == [0]
+    assert test_table.indices(latitude_min=45.8, elevation_max=2500) == [0]
+    assert test_table.indices(longitude_min=-110.9) == [0]
+    assert test_table.indices(longitude_max=-110.9, region="MT") == [1, 3]
+
+    # The index is rebuilt when rows are added
+    test_table.add_pit(test_table.pits[0])
+    assert test_table.indices(latitude_max=45.82) == [0, 4]
+    assert test_table.filter(latitude_max=45.82)[1] is test_table.pits[4]
+
+
+def test_filter(test_table):
+    """Test that filter returns the matching pits"""
+    pits = test_table.filter(region="CO")
+    assert len(pits) == 1
+    assert pits[0] is test_table.pits[2]
+    assert pits[0].core_info.pit_id == "25670"
+
+
+def test_string_representation(test_table):
+    """Test string representation of SnowPitTable"""
+    assert str(test_table) == "SnowPitTable: 4 pits"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
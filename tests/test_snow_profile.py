@@ -1,4 +1,7 @@
+import importlib
+import math
 import os
+import subprocess
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -7,6 +10,7 @@ import pytest
 from unittest.mock import patch, Mock
 
 from snowpylot.caaml_parser import caaml_parser, caaml_url_parser
+from snowpylot.snow_profile import DensityObs, SnowProfile, TempObs
 
 def test_get_data_from_caaml_url_parser():
     html_content = f'<html><body><a href="/snowpit/99999/download/caaml">Download CAAML</a></body></html>'
@@ -33,7 +37,88 @@ def test_get_data_from_caaml_url_parser():
             result = caaml_url_parser('https://fakeapi.com')
             mock_parse.assert_called_once()
     assert result == 'dummy_result'
-    
+
+
+def test_caaml_url_parser_with_session():
+    """Test that both requests go through a given session"""
+    html_content = (
+        '<html><body><a href="/snowpit/99999/download/caaml">'
+        "Download CAAML</a></body></html>"
+    )
+    caaml_content = '<?xml version="1.0"?><caaml:CAAML xmlns:caaml="http://caaml.org"/>'
+
+    def mock_session_get(url, timeout=10):
+        mock_resp = Mock()
+        if url.endswith("/caaml"):
+            mock_resp.content = caaml_content.encode()
+        else:
+            mock_resp.text = html_content
+        return mock_resp
+
+    session = Mock()
+    session.get.side_effect = mock_session_get
+
+    with patch('snowpylot.caaml_parser.requests.get') as mock_get:
+        with patch('snowpylot.caaml_parser._parse_caaml', return_value='dummy_result'):
+            result = caaml_url_parser('https://fakeapi.com/node/99999', session=session)
+        mock_get.assert_not_called()
+
+    assert result == 'dummy_result'
+    assert session.get.call_count == 2
+    assert session.get.call_args_list[1].args[0] == 'https://fakeapi.com/snowpit/99999/download/caaml'
+
+
+def test_http_dependencies_are_imported_lazily():
+    """Test that importing snowpylot does not import requests or bs4"""
+    code = (
+        "import sys, snowpylot; "
+        "print('requests' in sys.modules, 'bs4' in sys.modules)"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_patched_module_attributes_are_used():
+    """Test that caaml_url_parser uses the module's requests and BeautifulSoup"""
+    from bs4 import BeautifulSoup
+
+    module = importlib.import_module("snowpylot.caaml_parser")
+    html_content = (
+        '<html><body><a href="/snowpit/99999/download/caaml">'
+        "Download CAAML</a></body></html>"
+    )
+
+    def mock_requests_get(url, timeout=10):
+        mock_resp = Mock()
+        mock_resp.text = html_content
+        mock_resp.content = b'<?xml version="1.0"?><caaml:CAAML xmlns:caaml="x"/>'
+        return mock_resp
+
+    with patch.object(module, "requests") as mock_requests, patch.object(
+        module, "BeautifulSoup", side_effect=BeautifulSoup
+    ) as mock_soup, patch.object(module, "_parse_caaml", return_value="dummy_result"):
+        mock_requests.get.side_effect = mock_requests_get
+        result = caaml_url_parser("https://fakeapi.com/node/99999")
+
+    assert result == "dummy_result"
+    assert mock_requests.get.call_count == 2
+    mock_soup.assert_called_once()
+
+
+def test_unknown_module_attribute():
+    """Test that unknown attributes of caaml_parser are still reported"""
+    module = importlib.import_module("snowpylot.caaml_parser")
+    with pytest.raises(AttributeError):
+        _ = module.missing
+
+
 @pytest.fixture
 def test_pit():
     """Fixture to load the test snowpit file"""
@@ -137,6 +222,78 @@ def test_grain_form_classification(test_pit):
         assert grain.basic_grain_class_name == expected_class
 
 
+def test_computed_layer_properties(test_pit):
+    """Test properties derived from the parsed layer codes"""
+    layer7 = test_pit.snow_profile.layers[6]
+    assert layer7.wetness_desc == "Dry"
+    assert layer7.grain_form_primary.basic_grain_class_code == "SH"
+    assert layer7.grain_form_primary.sub_grain_class_code == "SHxr"
+    assert layer7.grain_form_primary.sub_grain_class_name == "Rounding surface hoar"
+
+    layer1 = test_pit.snow_profile.layers[0]
+    assert layer1.wetness_desc == "Dry to moist"
+    assert layer1.grain_form_primary.sub_grain_class_code is None
+    assert layer1.grain_form_primary.sub_grain_class_name is None
+
+
+def test_numeric_columns(test_pit):
+    """Test the float32 columns built from the layers and observations"""
+    profile = test_pit.snow_profile
+    layer_depths = profile.layer_depth_column()
+    assert len(layer_depths) == 11
+    assert layer_depths[6] == 66.0
+    assert profile.layer_thickness_column()[-1] == 30.0
+    temp_depths = profile.temp_depth_column()
+    assert len(temp_depths) == 16
+    assert temp_depths[7] == 65.0
+    temps = profile.temp_column()
+    assert temps.typecode == "f"
+    assert temps[7] == pytest.approx(-2.78)
+    assert len(profile.density_column()) == 0
+
+    gradient = profile.temp_gradient()
+    assert len(gradient) == 15
+    assert gradient[0] == pytest.approx(-0.278)
+    assert gradient[6] == pytest.approx(0.111, abs=1e-6)
+
+    # Values are converted to fixed units, missing values are stored as NaN
+    profile = SnowProfile(
+        temp_profile=[TempObs(depth=[0.1, "m"], snow_temp=[23.0, "degF"])],
+        density_profile=[DensityObs(density=[250.0, "kgm-3"]), DensityObs()],
+    )
+    assert profile.temp_depth_column()[0] == pytest.approx(10.0)
+    assert profile.temp_column()[0] == pytest.approx(-5.0)
+
+    # The gradient is in degC/cm whatever the parsed units
+    profile.temp_profile.append(TempObs(depth=[200.0, "mm"], snow_temp=[-3.0, "degC"]))
+    assert profile.temp_gradient()[0] == pytest.approx(0.2)
+    densities = profile.density_column()
+    assert densities[0] == 250.0
+    assert math.isnan(densities[1])
+
+
+def test_as_dict_includes_computed_values(test_pit):
+    """Test that as_dict() keeps the values computed by properties"""
+    pit_dict = test_pit.as_dict()
+
+    layer7 = pit_dict["snow_profile"]["layers"][6]
+    assert layer7["depth_top"] == [66.0, "cm"]
+    assert layer7["wetness_desc"] == "Dry"
+    assert layer7["grain_form_primary"]["sub_grain_class_name"] == (
+        "Rounding surface hoar"
+    )
+
+    ect = pit_dict["stability_tests"]["ECT"][0]
+    assert ect["test_score"] == "ECTN4"
+    assert ect["propagation"] is False
+    assert ect["num_taps"] == "4"
+
+    weather = pit_dict["core_info"]["weather_conditions"]
+    sky_cond_desc = test_pit.core_info.weather_conditions.sky_cond_desc
+    assert weather["sky_cond_desc"] == sky_cond_desc
+    assert "wind_speed_desc" in weather
+
+
 def test_layer_of_concern(test_pit):
     """Test layer of concern identification"""
     profile = test_pit.snow_profile